@@ -7,7 +7,10 @@ Integrates with the artifact store for persistence.
 
 from __future__ import annotations
 
+import asyncio
+import os
 from datetime import UTC, datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -17,10 +20,18 @@ from chuk_mcp_music.models.arrangement import (
     Arrangement,
     ArrangementContext,
     EnergyLevel,
+    Layer,
     LayerRole,
     PatternRef,
 )
 
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeDumper as YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
 
 class ArrangementMetadata:
     """Lightweight metadata for listing arrangements."""
@@ -46,6 +57,18 @@ class ArrangementMetadata:
     def __repr__(self) -> str:
         return f"ArrangementMetadata({self.name!r}, {self.key}, {self.tempo}bpm)"
 
+    @cached_property
+    def as_dict(self) -> dict[str, Any]:
+        """Listing fields as a dict (metadata is a point-in-time snapshot)."""
+        return {
+            "name": self.name,
+            "key": self.key,
+            "tempo": self.tempo,
+            "total_bars": self.total_bars,
+            "layers": self.layer_count,
+            "modified": self.modified,
+        }
+
 
 class ArrangementManager:
     """
@@ -64,6 +87,8 @@ class ArrangementManager:
         """
         self.arrangements_dir = arrangements_dir
         self._cache: dict[str, Arrangement] = {}
+        # Listing metadata by path, tagged with the file's (mtime, size)
+        self._listing: dict[Path, tuple[tuple[int, int], ArrangementMetadata]] = {}
 
     async def create(
         self,
@@ -147,10 +172,11 @@ class ArrangementManager:
         path = self._get_path(arrangement.name)
 
         with open(path, "w") as f:
-            yaml.safe_dump(yaml_dict, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(yaml_dict, f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
 
         # Update cache
         self._cache[arrangement.name] = arrangement
+        self._listing.pop(path, None)
 
         return path
 
@@ -164,13 +190,19 @@ class ArrangementManager:
         Returns:
             The loaded Arrangement
         """
-        with open(path) as f:
-            data = yaml.safe_load(f)
-
-        arrangement = Arrangement.from_yaml_dict(data)
+        # File read and YAML parse run in a worker thread so concurrent
+        # loads (e.g. both sides of a diff) overlap
+        arrangement = await asyncio.to_thread(self._read_arrangement, path)
         self._cache[arrangement.name] = arrangement
         return arrangement
 
+    @staticmethod
+    def _read_arrangement(path: Path) -> Arrangement:
+        """Read and parse an arrangement file."""
+        with open(path) as f:
+            data = yaml.load(f, Loader=YamlLoader)
+        return Arrangement.from_yaml_dict(data)
+
     async def list_arrangements(self) -> list[ArrangementMetadata]:
         """
         List all arrangements in the directory.
@@ -181,32 +213,58 @@ class ArrangementManager:
         if not self.arrangements_dir.exists():
             return []
 
+        paths = list(self.arrangements_dir.glob("*.arrangement.yaml"))
         result = []
-        for path in self.arrangements_dir.glob("*.arrangement.yaml"):
+        misses = []
+        for path in paths:
             try:
-                with open(path) as f:
-                    data = yaml.safe_load(f)
-
-                sections = data.get("sections", [])
-                total_bars = sum(s.get("bars", 0) for s in sections)
-
-                result.append(
-                    ArrangementMetadata(
-                        name=data.get("name", path.stem),
-                        path=path,
-                        key=data.get("context", {}).get("key", "C_major"),
-                        tempo=data.get("context", {}).get("tempo", 120),
-                        total_bars=total_bars,
-                        layer_count=len(data.get("layers", {})),
-                        modified=datetime.fromtimestamp(path.stat().st_mtime),
-                    )
-                )
-            except Exception:
-                # Skip files that can't be parsed
-                continue
+                stat = path.stat()
+            except OSError:
+                continue  # Removed since the glob
+            version = (stat.st_mtime_ns, stat.st_size)
+            cached = self._listing.get(path)
+            if cached is not None and cached[0] == version:
+                result.append(cached[1])
+            else:
+                misses.append((path, version, stat))
+
+        # Changed files are parsed in worker threads; the cache itself is only
+        # touched here on the event loop
+        parsed = await asyncio.gather(
+            *(asyncio.to_thread(self._read_metadata, path, stat) for path, _v, stat in misses),
+            return_exceptions=True,
+        )
+        for (path, version, _stat), metadata in zip(misses, parsed, strict=True):
+            if isinstance(metadata, BaseException):
+                continue  # Skip files that can't be parsed
+            self._listing[path] = (version, metadata)
+            result.append(metadata)
+
+        # Forget files that have gone away since the last listing
+        for path in self._listing.keys() - set(paths):
+            del self._listing[path]
 
         return sorted(result, key=lambda m: m.modified, reverse=True)
 
+    @staticmethod
+    def _read_metadata(path: Path, stat: os.stat_result) -> ArrangementMetadata:
+        """Read listing metadata from an arrangement file."""
+        with open(path) as f:
+            data = yaml.load(f, Loader=YamlLoader)
+
+        sections = data.get("sections", [])
+        total_bars = sum(s.get("bars", 0) for s in sections)
+
+        return ArrangementMetadata(
+            name=data.get("name", path.stem),
+            path=path,
+            key=data.get("context", {}).get("key", "C_major"),
+            tempo=data.get("context", {}).get("tempo", 120),
+            total_bars=total_bars,
+            layer_count=len(data.get("layers", {})),
+            modified=datetime.fromtimestamp(stat.st_mtime),
+        )
+
     async def delete(self, name: str) -> bool:
         """
         Delete an arrangement.
@@ -222,6 +280,7 @@ class ArrangementManager:
         if path.exists():
             path.unlink()
             self._cache.pop(name, None)
+            self._listing.pop(path, None)
             return True
 
         return False
@@ -290,6 +349,122 @@ class ArrangementManager:
         arrangement.add_section(section_name, bars, energy_level, position)
         return arrangement
 
+    async def add_sections(
+        self,
+        name: str,
+        sections: list[dict[str, Any]],
+    ) -> Arrangement:
+        """
+        Append several sections to an arrangement.
+
+        Either every section is added or, if any is invalid, none are.
+
+        Args:
+            name: Arrangement name
+            sections: Section specs with 'name', 'bars' and optional 'energy'
+
+        Returns:
+            The updated Arrangement
+        """
+        arrangement = await self.get(name)
+        if arrangement is None:
+            raise ValueError(f"Arrangement not found: {name}")
+
+        previous = list(arrangement.sections)
+        try:
+            for spec in sections:
+                energy = spec.get("energy")
+                arrangement.add_section(
+                    spec.get("name"),
+                    spec.get("bars"),
+                    EnergyLevel(energy) if energy else None,
+                )
+        except Exception:
+            arrangement.sections = previous
+            raise
+        return arrangement
+
+    async def remove_section(self, name: str, section_name: str) -> Arrangement:
+        """
+        Remove a section from an arrangement.
+
+        Args:
+            name: Arrangement name
+            section_name: Section name
+
+        Returns:
+            The updated Arrangement
+        """
+        arrangement = await self.get(name)
+        if arrangement is None:
+            raise ValueError(f"Arrangement not found: {name}")
+
+        if not arrangement.remove_section(section_name):
+            raise ValueError(f"Section not found: {section_name}")
+        return arrangement
+
+    async def reorder_sections(self, name: str, order: list[str]) -> Arrangement:
+        """
+        Reorder the sections of an arrangement.
+
+        Sections left out of the order are dropped.
+
+        Args:
+            name: Arrangement name
+            order: Section names in their new order
+
+        Returns:
+            The updated Arrangement
+        """
+        arrangement = await self.get(name)
+        if arrangement is None:
+            raise ValueError(f"Arrangement not found: {name}")
+
+        # Validate with set operations before touching the arrangement
+        section_map = {s.name: s for s in arrangement.sections}
+        order_set = set(order)
+        if len(order_set) != len(order):
+            raise ValueError("Section order contains duplicates")
+        missing = order_set.difference(section_map)
+        if missing:
+            missing_name = next(n for n in order if n in missing)
+            raise ValueError(f"Section not found: {missing_name}")
+
+        arrangement.sections = [section_map[n] for n in order]
+        arrangement.modified = datetime.now(UTC)
+        return arrangement
+
+    async def set_section_energy(
+        self,
+        name: str,
+        section_name: str,
+        energy: str | EnergyLevel,
+    ) -> Arrangement:
+        """
+        Set the energy level of a section.
+
+        Args:
+            name: Arrangement name
+            section_name: Section name
+            energy: Energy level (name or EnergyLevel)
+
+        Returns:
+            The updated Arrangement
+        """
+        arrangement = await self.get(name)
+        if arrangement is None:
+            raise ValueError(f"Arrangement not found: {name}")
+
+        index = arrangement.section_index(section_name)
+        if index is None:
+            raise ValueError(f"Section not found: {section_name}")
+
+        # Sections are frozen, so we need to replace
+        sections = arrangement.sections
+        sections[index] = sections[index].model_copy(update={"energy": EnergyLevel(energy)})
+        arrangement.modified = datetime.now(UTC)
+        return arrangement
+
     async def add_layer(
         self,
         name: str,
@@ -316,6 +491,84 @@ class ArrangementManager:
         arrangement.add_layer(layer_name, LayerRole(role), channel)
         return arrangement
 
+    async def add_layers(
+        self,
+        name: str,
+        layers: list[dict[str, Any]],
+    ) -> Arrangement:
+        """
+        Add several layers to an arrangement.
+
+        Either every layer is added or, if any is invalid, none are.
+
+        Args:
+            name: Arrangement name
+            layers: Layer specs with 'name', 'role' and optional 'channel'
+
+        Returns:
+            The updated Arrangement
+        """
+        arrangement = await self.get(name)
+        if arrangement is None:
+            raise ValueError(f"Arrangement not found: {name}")
+
+        previous = dict(arrangement.layers)
+        try:
+            for spec in layers:
+                arrangement.add_layer(
+                    spec.get("name"),
+                    LayerRole(spec.get("role")),
+                    spec.get("channel"),
+                )
+        except Exception:
+            arrangement.layers = previous
+            raise
+        return arrangement
+
+    async def remove_layer(self, name: str, layer_name: str) -> Arrangement:
+        """
+        Remove a layer from an arrangement.
+
+        Args:
+            name: Arrangement name
+            layer_name: Layer name
+
+        Returns:
+            The updated Arrangement
+        """
+        arrangement = await self.get(name)
+        if arrangement is None:
+            raise ValueError(f"Arrangement not found: {name}")
+
+        if not arrangement.remove_layer(layer_name):
+            raise ValueError(f"Layer not found: {layer_name}")
+        return arrangement
+
+    async def update_layer(self, name: str, layer_name: str, **changes: Any) -> Layer:
+        """
+        Update settings on a layer.
+
+        Args:
+            name: Arrangement name
+            layer_name: Layer name
+            **changes: Layer fields to set (e.g. muted=True, level=0.8)
+
+        Returns:
+            The updated Layer
+        """
+        arrangement = await self.get(name)
+        if arrangement is None:
+            raise ValueError(f"Arrangement not found: {name}")
+
+        layer = arrangement.get_layer(layer_name)
+        if layer is None:
+            raise ValueError(f"Layer not found: {layer_name}")
+
+        for field, value in changes.items():
+            setattr(layer, field, value)
+        arrangement.modified = datetime.now(UTC)
+        return layer
+
     async def assign_pattern(
         self,
         name: str,
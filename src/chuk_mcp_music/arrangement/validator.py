@@ -86,23 +86,31 @@ class ValidationResult:
 class ArrangementValidator:
     """Validates arrangement structure and constraints."""
 
-    def validate(self, arrangement: Arrangement) -> ValidationResult:
+    def validate(self, arrangement: Arrangement, fail_fast: bool = False) -> ValidationResult:
         """
         Validate an arrangement.
 
         Args:
             arrangement: The arrangement to validate
+            fail_fast: Stop after the first check that reports an error,
+                skipping the remaining checks
 
         Returns:
             ValidationResult with any issues found
         """
         result = ValidationResult()
 
-        self._validate_sections(arrangement, result)
-        self._validate_layers(arrangement, result)
-        self._validate_harmony(arrangement, result)
-        self._validate_channel_conflicts(arrangement, result)
-        self._validate_structure(arrangement, result)
+        checks = (
+            self._validate_sections,
+            self._validate_layers,
+            self._validate_harmony,
+            self._validate_channel_conflicts,
+            self._validate_structure,
+        )
+        for check in checks:
+            check(arrangement, result)
+            if fail_fast and not result.is_valid:
+                break
 
         return result
 
@@ -261,15 +269,16 @@ class ArrangementValidator:
             )
 
 
-def validate_arrangement(arrangement: Arrangement) -> ValidationResult:
+def validate_arrangement(arrangement: Arrangement, fail_fast: bool = False) -> ValidationResult:
     """
     Convenience function to validate an arrangement.
 
     Args:
         arrangement: The arrangement to validate
+        fail_fast: Stop after the first check that reports an error
 
     Returns:
         ValidationResult with any issues found
     """
     validator = ArrangementValidator()
-    return validator.validate(arrangement)
+    return validator.validate(arrangement, fail_fast=fail_fast)
@@ -74,10 +74,12 @@ music_delete_arrangement = arrangement_tools["music_delete_arrangement"]
 music_duplicate_arrangement = arrangement_tools["music_duplicate_arrangement"]
 
 music_add_section = structure_tools["music_add_section"]
+music_add_sections = structure_tools["music_add_sections"]
 music_remove_section = structure_tools["music_remove_section"]
 music_reorder_sections = structure_tools["music_reorder_sections"]
 music_set_section_energy = structure_tools["music_set_section_energy"]
 music_add_layer = structure_tools["music_add_layer"]
+music_add_layers = structure_tools["music_add_layers"]
 music_remove_layer = structure_tools["music_remove_layer"]
 music_arrange_layer = structure_tools["music_arrange_layer"]
 music_mute_layer = structure_tools["music_mute_layer"]
@@ -93,6 +95,7 @@ music_update_pattern_params = pattern_tools["music_update_pattern_params"]
 music_copy_pattern_to_project = pattern_tools["music_copy_pattern_to_project"]
 
 music_compile_midi = compilation_tools["music_compile_midi"]
+music_compile_midi_batch = compilation_tools["music_compile_midi_batch"]
 music_preview_section = compilation_tools["music_preview_section"]
 music_export_yaml = compilation_tools["music_export_yaml"]
 music_validate = compilation_tools["music_validate"]
@@ -19,6 +19,7 @@ and debugging.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -27,7 +28,7 @@ from mido import MidiFile
 from chuk_mcp_music.compiler.midi import (
     TICKS_PER_BEAT,
     MidiEvent,
-    events_to_midi,
+    score_ir_to_midi,
 )
 from chuk_mcp_music.compiler.score_ir import (
     IRNote,
@@ -51,22 +52,33 @@ if TYPE_CHECKING:
 
 @dataclass
 class CompileResult:
-    """Result of compiling an arrangement."""
+    """
+    Result of compiling an arrangement.
+
+    The MIDI file is encoded from the Score IR on first access, so callers
+    that only inspect the IR never pay for MIDI encoding.
+    """
 
-    midi_file: MidiFile
     score_ir: ScoreIR
     total_bars: int
     total_events: int
     layers_compiled: list[str]
     sections_compiled: list[str]
 
+    @cached_property
+    def midi_file(self) -> MidiFile:
+        """The compiled MIDI file."""
+        return score_ir_to_midi(self.score_ir)
+
 
 class ArrangementCompiler:
     """
     Compiles an Arrangement to a MIDI file.
 
     The compiler orchestrates the full pipeline from high-level
-    arrangement to concrete MIDI output.
+    arrangement to concrete MIDI output. It holds no per-compile state, so
+    one instance can serve concurrent compile() / compile_section() calls
+    from several threads.
     """
 
     def __init__(
@@ -236,23 +248,7 @@ class ArrangementCompiler:
             layers=layer_info,
         ).canonicalize()
 
-        # Convert IR notes to MidiEvents for MIDI export
-        midi_events = [
-            MidiEvent(
-                pitch=note.pitch,
-                start_ticks=note.start_ticks,
-                duration_ticks=note.duration_ticks,
-                velocity=note.velocity,
-                channel=note.channel,
-            )
-            for note in score_ir.notes
-        ]
-
-        # Create MIDI file
-        midi_file = events_to_midi(midi_events, tempo_bpm=tempo)
-
         return CompileResult(
-            midi_file=midi_file,
             score_ir=score_ir,
             total_bars=current_bar,
             total_events=len(score_ir.notes),
@@ -387,22 +383,7 @@ class ArrangementCompiler:
             layers=layer_info,
         ).canonicalize()
 
-        # Convert to MIDI events
-        midi_events_final = [
-            MidiEvent(
-                pitch=note.pitch,
-                start_ticks=note.start_ticks,
-                duration_ticks=note.duration_ticks,
-                velocity=note.velocity,
-                channel=note.channel,
-            )
-            for note in score_ir.notes
-        ]
-
-        midi_file = events_to_midi(midi_events_final, tempo_bpm=tempo)
-
         return CompileResult(
-            midi_file=midi_file,
             score_ir=score_ir,
             total_bars=section.bars,
             total_events=len(score_ir.notes),
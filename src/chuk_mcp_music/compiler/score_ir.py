@@ -15,13 +15,36 @@ from __future__ import annotations
 
 import json
 from dataclasses import asdict, dataclass, field
-from typing import Any
+from itertools import repeat
+from operator import attrgetter
+from typing import IO, Any
+
+import orjson
 
 # Current schema version
 SCHEMA_VERSION = "score_ir/v1"
 
-
-@dataclass(frozen=True, order=True)
+# Same ordering as IRNote's compare fields, evaluated once per note when sorting
+_NOTE_SORT_KEY = attrgetter("start_ticks", "channel", "pitch", "duration_ticks", "velocity")
+
+# IRNote fields in constructor order, used for the columnar note layout
+NOTE_COLUMNS = (
+    "start_ticks",
+    "channel",
+    "pitch",
+    "duration_ticks",
+    "velocity",
+    "source_layer",
+    "source_pattern",
+    "source_section",
+    "bar",
+    "beat",
+)
+_NOTE_ROW = attrgetter(*NOTE_COLUMNS)
+_REQUIRED_NOTE_COLUMNS = NOTE_COLUMNS[:5]
+
+
+@dataclass(frozen=True, order=True, slots=True)
 class IRNote:
     """
     A single note in the Score IR.
@@ -224,7 +247,7 @@ class ScoreIR:
             ticks_per_beat=self.ticks_per_beat,
             total_ticks=self.total_ticks,
             total_bars=self.total_bars,
-            notes=sorted(self.notes),  # IRNote has __lt__ via order=True
+            notes=sorted(self.notes, key=_NOTE_SORT_KEY),
             sections=sorted(self.sections, key=lambda s: s.start_ticks),
             tempo_events=sorted(self.tempo_events, key=lambda t: t.ticks),
             layers=dict(sorted(self.layers.items())),
@@ -252,6 +275,78 @@ class ScoreIR:
             "layers": ir.layers,
         }
 
+    def to_columns(self) -> dict[str, list[Any]]:
+        """
+        Return the canonical notes as one list per field.
+
+        Keys are NOTE_COLUMNS; every list has one entry per note. This
+        avoids building a dict for each note and serializes much faster
+        than the row form for large scores.
+        """
+        ir = self.canonicalize()
+        if not ir.notes:
+            return {name: [] for name in NOTE_COLUMNS}
+        columns = zip(*map(_NOTE_ROW, ir.notes), strict=True)
+        return {name: list(values) for name, values in zip(NOTE_COLUMNS, columns, strict=True)}
+
+    def write_json(
+        self,
+        out: IO[bytes],
+        include_notes: bool = True,
+        columnar: bool = False,
+    ) -> None:
+        """
+        Stream the canonical JSON form to a binary writer.
+
+        Produces the same document as to_dict(), but encodes notes one at a
+        time rather than materializing the whole note list first.
+
+        Args:
+            out: Binary writer (e.g. io.BytesIO or an open file)
+            include_notes: If False, write an empty notes list followed
+                by a note_count field instead of the notes
+            columnar: If True, write the notes as a note_columns object
+                (see to_columns) in place of the notes list
+        """
+        ir = self.canonicalize()
+        head = orjson.dumps(
+            {
+                "schema": ir.schema,
+                "name": ir.name,
+                "key": ir.key,
+                "tempo": ir.tempo,
+                "time_signature": ir.time_signature.to_dict(),
+                "ticks_per_beat": ir.ticks_per_beat,
+                "total_ticks": ir.total_ticks,
+                "total_bars": ir.total_bars,
+            }
+        )
+        tail_fields: dict[str, Any] = {
+            "sections": [s.to_dict() for s in ir.sections],
+            "tempo_events": [t.to_dict() for t in ir.tempo_events],
+            "layers": ir.layers,
+        }
+        if not include_notes:
+            tail_fields["note_count"] = ir.note_count()
+        tail = orjson.dumps(tail_fields)
+
+        out.write(head[:-1])
+        if include_notes and columnar:
+            out.write(b',"note_columns":')
+            out.write(orjson.dumps(ir.to_columns()))
+            out.write(b",")
+            out.write(tail[1:])
+            return
+
+        out.write(b',"notes":[')
+        if include_notes:
+            for i, note in enumerate(ir.notes):
+                if i:
+                    out.write(b",")
+                out.write(orjson.dumps(note.to_dict()))
+        out.write(b"],")
+        out.write(tail[1:])
+
     def to_json(self, indent: int = 2) -> str:
         """Serialize to JSON string."""
         return json.dumps(self.to_dict(), indent=indent)
@@ -270,7 +365,11 @@ class ScoreIR:
             ticks_per_beat=d.get("ticks_per_beat", 480),
             total_ticks=d.get("total_ticks", 0),
             total_bars=d.get("total_bars", 0),
-            notes=[IRNote.from_dict(n) for n in d.get("notes", [])],
+            notes=(
+                _notes_from_columns(d["note_columns"])
+                if "note_columns" in d
+                else [IRNote.from_dict(n) for n in d.get("notes", [])]
+            ),
             sections=[IRSectionMarker.from_dict(s) for s in d.get("sections", [])],
             tempo_events=[IRTempoEvent.from_dict(t) for t in d.get("tempo_events", [])],
             layers=d.get("layers", {}),
@@ -279,7 +378,7 @@ class ScoreIR:
     @classmethod
     def from_json(cls, json_str: str) -> ScoreIR:
         """Deserialize from JSON string."""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(orjson.loads(json_str))
 
     def note_count(self) -> int:
         """Total number of notes."""
@@ -339,16 +438,35 @@ class ScoreIR:
         self_notes = set(self.notes)
         other_notes = set(other.notes)
 
-        added = other_notes - self_notes
-        removed = self_notes - other_notes
-        unchanged = self_notes & other_notes
+        # Only counts are reported, so derive added/removed from the overlap
+        # instead of building the difference sets
+        unchanged = len(self_notes & other_notes)
 
         return {
-            "notes_added": len(added),
-            "notes_removed": len(removed),
-            "notes_unchanged": len(unchanged),
+            "notes_added": len(other_notes) - unchanged,
+            "notes_removed": len(self_notes) - unchanged,
+            "notes_unchanged": unchanged,
             "tempo_changed": self.tempo != other.tempo,
             "key_changed": self.key != other.key,
             "bars_changed": self.total_bars != other.total_bars,
             "sections_changed": [s.name for s in self.sections] != [s.name for s in other.sections],
         }
+
+
+def _notes_from_columns(columns: dict[str, list[Any]]) -> list[IRNote]:
+    """Rebuild notes from the columnar layout produced by ScoreIR.to_columns()."""
+    # Every column that is present must describe the same notes
+    lengths = {
+        name: len(columns[name])
+        for name in NOTE_COLUMNS
+        if name in _REQUIRED_NOTE_COLUMNS or columns.get(name) is not None
+    }
+    if len(set(lengths.values())) > 1:
+        raise ValueError(f"note_columns lengths differ: {lengths}")
+
+    fields = [
+        columns[name] if name in _REQUIRED_NOTE_COLUMNS else columns.get(name) or repeat(None)
+        for name in NOTE_COLUMNS
+    ]
+    # Optional columns may be absent and are padded with repeat(None)
+    return [IRNote(*row) for row in zip(*fields, strict=False)]
@@ -12,15 +12,26 @@ This is the central data structure for composition.
 
 from __future__ import annotations
 
+import hashlib
 from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 
+import orjson
 from pydantic import BaseModel, Field, field_validator
 
 from chuk_mcp_music.core.rhythm import TimeSignature
 from chuk_mcp_music.core.scale import Key
 
+# Arrangement fields left out of the YAML document; the schema version is
+# written under its own "schema" key and layer names are the mapping keys
+_YAML_EXCLUDE: dict[str, Any] = {
+    "schema_version": True,
+    "created": True,
+    "modified": True,
+    "layers": {"__all__": {"name"}},
+}
+
 
 class LayerRole(str, Enum):
     """
@@ -131,6 +142,22 @@ class Layer(BaseModel):
             return None
         return self.patterns.get(pattern_alias)
 
+    def remove_pattern(self, alias: str) -> list[str]:
+        """
+        Remove a pattern alias and silence the sections that used it.
+
+        Args:
+            alias: Pattern alias to remove
+
+        Returns:
+            Names of the sections that referenced the alias
+        """
+        del self.patterns[alias]
+        cleared = [section for section, used in self.arrangement.items() if used == alias]
+        for section in cleared:
+            self.arrangement[section] = None
+        return cleared
+
 
 class HarmonyProgression(BaseModel):
     """
@@ -239,6 +266,25 @@ class Arrangement(BaseModel):
         """Get total number of bars in the arrangement."""
         return sum(section.bars for section in self.sections)
 
+    def summary(self) -> dict[str, Any]:
+        """
+        Get a compact overview of the arrangement.
+
+        Returns:
+            Dict with name, context, total bars, and section/layer counts
+        """
+        context = self.context
+        return {
+            "name": self.name,
+            "key": context.key,
+            "tempo": context.tempo,
+            "time_signature": context.time_signature,
+            "style": context.style,
+            "total_bars": self.total_bars(),
+            "sections": len(self.sections),
+            "layers": len(self.layers),
+        }
+
     def get_section_names(self) -> list[str]:
         """Get ordered list of section names."""
         return [section.name for section in self.sections]
@@ -250,6 +296,13 @@ class Arrangement(BaseModel):
                 return section
         return None
 
+    def section_index(self, name: str) -> int | None:
+        """Get the position of a section by name."""
+        for i, section in enumerate(self.sections):
+            if section.name == name:
+                return i
+        return None
+
     def get_layer(self, name: str) -> Layer | None:
         """Get a layer by name."""
         return self.layers.get(name)
@@ -301,12 +354,12 @@ class Arrangement(BaseModel):
 
         Returns True if removed, False if not found.
         """
-        for i, section in enumerate(self.sections):
-            if section.name == name:
-                self.sections.pop(i)
-                self.modified = datetime.now(UTC)
-                return True
-        return False
+        index = self.section_index(name)
+        if index is None:
+            return False
+        self.sections.pop(index)
+        self.modified = datetime.now(UTC)
+        return True
 
     def add_layer(self, name: str, role: LayerRole, channel: int | None = None) -> Layer:
         """
@@ -362,45 +415,22 @@ class Arrangement(BaseModel):
         """
         return {
             "schema": self.schema_version,
-            "name": self.name,
-            "context": {
-                "key": self.context.key,
-                "tempo": self.context.tempo,
-                "time_signature": self.context.time_signature,
-                "style": self.context.style,
-            },
-            "harmony": {
-                "default_progression": self.harmony.default_progression,
-                "harmonic_rhythm": self.harmony.harmonic_rhythm,
-                "sections": {
-                    name: {
-                        "progression": prog.progression,
-                        "harmonic_rhythm": prog.harmonic_rhythm,
-                    }
-                    for name, prog in self.harmony.sections.items()
-                },
-            },
-            "sections": [
-                {"name": s.name, "bars": s.bars, "energy": s.energy.value if s.energy else None}
-                for s in self.sections
-            ],
-            "layers": {
-                name: {
-                    "role": layer.role.value,
-                    "channel": layer.channel,
-                    "patterns": {
-                        alias: {"ref": p.ref, "variant": p.variant, "params": p.params}
-                        for alias, p in layer.patterns.items()
-                    },
-                    "arrangement": layer.arrangement,
-                    "muted": layer.muted,
-                    "solo": layer.solo,
-                    "level": layer.level,
-                }
-                for name, layer in self.layers.items()
-            },
+            **self.model_dump(mode="json", exclude=_YAML_EXCLUDE),
         }
 
+    def fingerprint(self) -> str:
+        """
+        Get a content hash of the arrangement.
+
+        Two arrangements with the same canonical YAML content share a
+        fingerprint; timestamps are not included.
+
+        Returns:
+            Hex digest identifying the arrangement content
+        """
+        canonical = orjson.dumps(self.to_yaml_dict(), option=orjson.OPT_SORT_KEYS)
+        return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
     @classmethod
     def from_yaml_dict(cls, data: dict[str, Any]) -> Arrangement:
         """
@@ -408,65 +438,35 @@ class Arrangement(BaseModel):
 
         This parses the canonical YAML format.
         """
-        context = ArrangementContext(
-            key=data["context"]["key"],
-            tempo=data["context"]["tempo"],
-            time_signature=data["context"].get("time_signature", "4/4"),
-            style=data["context"].get("style"),
-        )
-
-        harmony_data = data.get("harmony", {})
-        harmony = Harmony(
-            default_progression=harmony_data.get("default_progression", ["I"]),
-            harmonic_rhythm=harmony_data.get("harmonic_rhythm", "1bar"),
-            sections={
-                name: HarmonyProgression(
-                    progression=prog.get("progression", ["I"]),
-                    harmonic_rhythm=prog.get("harmonic_rhythm", "1bar"),
-                )
-                for name, prog in harmony_data.get("sections", {}).items()
-            },
-        )
+        harmony = data.get("harmony", {})
+        layers = {
+            name: {
+                **layer,
+                "name": name,
+                "patterns": {
+                    # Patterns may be given as a simple string reference
+                    alias: {"ref": pdata} if isinstance(pdata, str) else pdata
+                    for alias, pdata in layer.get("patterns", {}).items()
+                },
+            }
+            for name, layer in data.get("layers", {}).items()
+        }
 
-        sections = [
-            Section(
-                name=s["name"],
-                bars=s["bars"],
-                energy=EnergyLevel(s["energy"]) if s.get("energy") else None,
-            )
-            for s in data.get("sections", [])
-        ]
-
-        layers = {}
-        for name, layer_data in data.get("layers", {}).items():
-            patterns = {}
-            for alias, pdata in layer_data.get("patterns", {}).items():
-                if isinstance(pdata, str):
-                    # Simple string reference
-                    patterns[alias] = PatternRef(ref=pdata)
-                else:
-                    patterns[alias] = PatternRef(
-                        ref=pdata["ref"],
-                        variant=pdata.get("variant"),
-                        params=pdata.get("params", {}),
-                    )
-
-            layers[name] = Layer(
-                name=name,
-                role=LayerRole(layer_data["role"]),
-                channel=layer_data.get("channel", 0),
-                patterns=patterns,
-                arrangement=layer_data.get("arrangement", {}),
-                muted=layer_data.get("muted", False),
-                solo=layer_data.get("solo", False),
-                level=layer_data.get("level", 1.0),
-            )
-
-        return cls(
-            schema_version=data.get("schema", "arrangement/v1"),
-            name=data["name"],
-            context=context,
-            harmony=harmony,
-            sections=sections,
-            layers=layers,
+        return cls.model_validate(
+            {
+                "schema_version": data.get("schema", "arrangement/v1"),
+                "name": data["name"],
+                "context": data["context"],
+                "harmony": {
+                    **harmony,
+                    "sections": {
+                        name: {"progression": ["I"], **prog}
+                        for name, prog in harmony.get("sections", {}).items()
+                    },
+                },
+                "sections": [
+                    {**s, "energy": s.get("energy") or None} for s in data.get("sections", [])
+                ],
+                "layers": layers,
+            }
         )
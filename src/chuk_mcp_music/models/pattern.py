@@ -8,12 +8,17 @@ They define musical building blocks with parameters and variants.
 from __future__ import annotations
 
 from enum import Enum
+from functools import cached_property
+from types import MappingProxyType
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 from chuk_mcp_music.models.arrangement import LayerRole
 
+# Patterns with more events than this count as dense
+DENSE_EVENT_THRESHOLD = 8
+
 
 class ParameterType(str, Enum):
     """Types of pattern parameters."""
@@ -104,6 +109,15 @@ class PatternTemplate(BaseModel):
     loop: bool = Field(True, description="Whether pattern loops")
     events: list[PatternEvent] = Field(default_factory=list, description="Pattern events")
 
+    @cached_property
+    def is_dense(self) -> bool:
+        """
+        Whether the template has more than DENSE_EVENT_THRESHOLD events.
+
+        Computed once on first access; templates are not edited in place.
+        """
+        return len(self.events) > DENSE_EVENT_THRESHOLD
+
 
 class PatternVariant(BaseModel):
     """
@@ -163,7 +177,8 @@ class Pattern(BaseModel):
     # The actual pattern content
     template: PatternTemplate = Field(..., description="Pattern template")
 
-    model_config = {"populate_by_name": True}
+    # Frozen so the cached pattern_id/details never go stale
+    model_config = {"frozen": True, "populate_by_name": True}
 
     def get_resolved_params(
         self, variant: str | None = None, overrides: dict[str, Any] | None = None
@@ -212,6 +227,54 @@ class Pattern(BaseModel):
 
         return errors
 
+    @cached_property
+    def pattern_id(self) -> str:
+        """Default pattern ID in role/name form (e.g. 'bass/root-pulse')."""
+        return f"{self.role.value}/{self.name}"
+
+    @cached_property
+    def details(self) -> MappingProxyType[str, Any]:
+        """
+        JSON-ready description of parameters, variants, template and constraints.
+
+        Computed once on first access; loaded patterns are not edited in place.
+        """
+        return MappingProxyType(
+            {
+                "name": self.name,
+                "role": self.role.value,
+                "description": self.description,
+                "version": self.version,
+                "pitched": self.pitched,
+                "parameters": {
+                    name: {
+                        "type": param.param_type.value,
+                        "description": param.description,
+                        "values": param.values,
+                        "range": list(param.range) if param.range else None,
+                        "default": param.default,
+                    }
+                    for name, param in self.parameters.items()
+                },
+                "variants": {
+                    name: {
+                        "description": variant.description,
+                        "params": variant.params,
+                    }
+                    for name, variant in self.variants.items()
+                },
+                "template": {
+                    "bars": self.template.bars,
+                    "loop": self.template.loop,
+                    "event_count": len(self.template.events),
+                },
+                "constraints": {
+                    "requires_harmony": self.constraints.requires_harmony,
+                    "compatible_styles": self.constraints.compatible_styles,
+                },
+            }
+        )
+
 
 class PatternMetadata(BaseModel):
     """
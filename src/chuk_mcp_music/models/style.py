@@ -7,7 +7,12 @@ They're like design tokens for genre/mood constraints.
 
 from __future__ import annotations
 
+import fnmatch
+import re
+from collections.abc import Callable, Iterable
 from enum import Enum
+from functools import cached_property, lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -15,6 +20,32 @@ from pydantic import BaseModel, Field
 from chuk_mcp_music.models.arrangement import LayerRole
 
 
+def wildcard_matcher(patterns: Iterable[str]) -> Callable[[str], bool]:
+    """
+    Get a predicate matching IDs against any of the wildcard patterns.
+
+    Matchers are compiled once per distinct pattern list and cached,
+    so repeated checks against the same style hints are a single regex match.
+
+    Args:
+        patterns: Wildcard patterns (fnmatch syntax, e.g. 'arp-*')
+
+    Returns:
+        Callable returning True if an ID matches any pattern
+    """
+    return _compile_wildcards(tuple(patterns))
+
+
+@lru_cache(maxsize=256)
+def _compile_wildcards(patterns: tuple[str, ...]) -> Callable[[str], bool]:
+    """Compile wildcard patterns into a single regex predicate."""
+    if not patterns:
+        return lambda _id: False
+
+    regex = re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+    return lambda pattern_id: regex.match(pattern_id) is not None
+
+
 class PercussionDensity(str, Enum):
     """Percussion density levels."""
 
@@ -270,9 +301,59 @@ class Style(BaseModel):
 
     def _matches_any(self, pattern_id: str, patterns: list[str]) -> bool:
         """Check if pattern_id matches any pattern in the list (with wildcards)."""
-        import fnmatch
-
-        return any(fnmatch.fnmatch(pattern_id, pattern) for pattern in patterns)
+        return wildcard_matcher(patterns)(pattern_id)
+
+    @cached_property
+    def details(self) -> MappingProxyType[str, Any]:
+        """
+        JSON-ready description of tokens, energy levels, hints and limits.
+
+        Computed once on first access; loaded styles are frozen.
+        """
+        energy = self.energy_mapping
+        return MappingProxyType(
+            {
+                "name": self.name,
+                "description": self.description,
+                "tempo": {
+                    "min": self.tempo.min_bpm,
+                    "max": self.tempo.max_bpm,
+                    "default": self.tempo.default_bpm,
+                },
+                "key_preference": self.key_preference.value,
+                "time_signature": self.time_signature,
+                "energy_levels": {
+                    level: {
+                        "layers": constraints.layers,
+                        "percussion": constraints.percussion.value,
+                    }
+                    for level, constraints in (
+                        ("lowest", energy.lowest),
+                        ("low", energy.low),
+                        ("medium", energy.medium),
+                        ("high", energy.high),
+                        ("highest", energy.highest),
+                    )
+                },
+                "layer_hints": {
+                    role: {
+                        "suggested": hint.suggested,
+                        "avoid": hint.avoid,
+                        "register": hint.pitch_register,
+                    }
+                    for role, hint in self.layer_hints.items()
+                },
+                "structure": {
+                    "breakdown_required": self.structure_hints.breakdown_required,
+                    "typical_bars": self.structure_hints.typical_length_bars,
+                    "section_multiples": self.structure_hints.section_multiples,
+                },
+                "forbidden": {
+                    "patterns": self.forbidden.patterns,
+                    "progressions": self.forbidden.progressions,
+                },
+            }
+        )
 
     def to_yaml_dict(self) -> dict[str, Any]:
         """Convert to YAML-serializable dictionary."""
@@ -7,6 +7,8 @@ and user-owned patterns in a project.
 
 from __future__ import annotations
 
+import threading
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
@@ -29,7 +31,9 @@ class PatternRegistry:
     Discovers and loads patterns from library and project.
 
     The registry maintains a cache of loaded patterns and provides
-    filtering by role and style.
+    filtering by role and style. get_pattern() may be called from worker
+    threads (the compiler runs off the event loop); each pattern is loaded
+    at most once.
     """
 
     def __init__(
@@ -48,6 +52,10 @@ class PatternRegistry:
         self.project_path = project_path
         self._cache: dict[str, Pattern] = {}
         self._metadata_cache: dict[str, PatternMetadata] = {}
+        self._by_role: dict[LayerRole, tuple[Pattern, ...]] = {}
+        self._summaries: dict[tuple[LayerRole | None, str | None], tuple[dict[str, Any], ...]] = {}
+        self._generation = 0
+        self._load_lock = threading.Lock()
 
     def list_patterns(
         self,
@@ -77,6 +85,43 @@ class PatternRegistry:
 
         return sorted(result, key=lambda m: m.name)
 
+    def list_pattern_summaries(
+        self,
+        role: LayerRole | None = None,
+        style: str | None = None,
+    ) -> tuple[dict[str, Any], ...]:
+        """
+        List patterns as JSON-ready summary dicts.
+
+        Same filtering and order as list_patterns(). Results are cached per
+        filter until the registry changes; callers must not mutate them.
+
+        Args:
+            role: Filter by layer role
+            style: Filter by compatible style
+
+        Returns:
+            Tuple of pattern summary dicts
+        """
+        key = (role, style)
+        summaries = self._summaries.get(key)
+        if summaries is None:
+            rows = []
+            for m in self.list_patterns(role=role, style=style):
+                role_value = m.role.value
+                rows.append(
+                    {
+                        "id": role_value + "/" + m.name,
+                        "name": m.name,
+                        "role": role_value,
+                        "description": m.description,
+                        "pitched": m.pitched,
+                        "variants": m.variants,
+                    }
+                )
+            summaries = self._summaries[key] = tuple(rows)
+        return summaries
+
     def get_pattern(self, pattern_id: str) -> Pattern | None:
         """
         Get a pattern by ID.
@@ -90,16 +135,75 @@ class PatternRegistry:
             Pattern or None if not found
         """
         # Check cache
-        if pattern_id in self._cache:
-            return self._cache[pattern_id]
-
-        # Try to load
-        pattern = self._load_pattern(pattern_id)
-        if pattern:
-            self._cache[pattern_id] = pattern
+        pattern = self._cache.get(pattern_id)
+        if pattern is not None:
+            return pattern
+
+        # Try to load; re-check under the lock in case another thread won
+        with self._load_lock:
+            pattern = self._cache.get(pattern_id)
+            if pattern is None:
+                pattern = self._load_pattern(pattern_id)
+                if pattern:
+                    self._cache[pattern_id] = pattern
 
         return pattern
 
+    def get_patterns(self, pattern_ids: Iterable[str]) -> list[Pattern | None]:
+        """
+        Get several patterns by ID.
+
+        Cached patterns are read straight from the cache; the rest go
+        through get_pattern.
+
+        Args:
+            pattern_ids: Pattern identifiers
+
+        Returns:
+            Patterns in the same order, with None for any not found
+        """
+        cache = self._cache
+        return [
+            pattern
+            if (pattern := cache.get(pattern_id)) is not None
+            else self.get_pattern(pattern_id)
+            for pattern_id in pattern_ids
+        ]
+
+    def patterns_for_role(self, role: LayerRole) -> tuple[Pattern, ...]:
+        """
+        Get all loadable patterns for one role, ordered by name.
+
+        Only pattern files whose metadata lists this role are loaded. The
+        result is cached per role until the registry changes.
+
+        Args:
+            role: Layer role
+
+        Returns:
+            Patterns for that role
+        """
+        patterns = self._by_role.get(role)
+        if patterns is None:
+            self._ensure_metadata_loaded()
+
+            ids = sorted(
+                (meta.name, pattern_id)
+                for pattern_id, meta in self._metadata_cache.items()
+                if meta.role == role
+            )
+            loaded = self.get_patterns(pattern_id for _name, pattern_id in ids)
+            patterns = self._by_role[role] = tuple(
+                p for p in loaded if p is not None and p.role == role
+            )
+
+        return patterns
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped whenever registered patterns change."""
+        return self._generation
+
     def get_pattern_metadata(self, pattern_id: str) -> PatternMetadata | None:
         """
         Get metadata for a pattern.
@@ -130,6 +234,28 @@ class PatternRegistry:
         if not pattern:
             return None
 
+        target_path = self.write_project_copy(pattern)
+        self.invalidate_pattern(pattern_id)
+
+        return target_path
+
+    def write_project_copy(self, pattern: Pattern) -> Path:
+        """
+        Write a pattern into the project directory.
+
+        Only does file I/O, so it may run in a worker thread. Call
+        invalidate_pattern() afterwards (from the thread that owns the
+        registry) so the project copy takes precedence.
+
+        Args:
+            pattern: Pattern to write
+
+        Returns:
+            Path to the written pattern file
+        """
+        if not self.project_path:
+            raise ValueError("No project path configured")
+
         # Determine target path
         role_dir = self.project_path / pattern.role.value
         role_dir.mkdir(parents=True, exist_ok=True)
@@ -141,11 +267,18 @@ class PatternRegistry:
         with open(target_path, "w") as f:
             yaml.safe_dump(yaml_dict, f, default_flow_style=False, sort_keys=False)
 
-        # Clear caches so project pattern takes precedence
+        return target_path
+
+    def invalidate_pattern(self, pattern_id: str) -> None:
+        """
+        Drop cached data for a pattern whose files changed on disk.
+
+        Args:
+            pattern_id: Pattern identifier
+        """
         self._cache.pop(pattern_id, None)
         self._metadata_cache.clear()
-
-        return target_path
+        self._patterns_changed()
 
     def register_pattern(self, pattern: Pattern, pattern_id: str | None = None) -> str:
         """
@@ -161,13 +294,20 @@ class PatternRegistry:
             The pattern ID
         """
         if pattern_id is None:
-            pattern_id = f"{pattern.role.value}/{pattern.name}"
+            pattern_id = pattern.pattern_id
 
         self._cache[pattern_id] = pattern
         self._metadata_cache[pattern_id] = PatternMetadata.from_pattern(pattern)
+        self._patterns_changed()
 
         return pattern_id
 
+    def _patterns_changed(self) -> None:
+        """Drop derived indexes after the set of patterns changes."""
+        self._by_role.clear()
+        self._summaries.clear()
+        self._generation += 1
+
     def _ensure_metadata_loaded(self) -> None:
         """Load metadata for all available patterns."""
         if self._metadata_cache:
@@ -51,6 +51,8 @@ class StyleLoader:
         self.library_path = library_path or (Path(__file__).parent / "library")
         self.project_path = project_path
         self._cache: dict[str, Style] = {}
+        # Listing metadata per file, with the mtime it was parsed at
+        self._listing: dict[Path, tuple[int, StyleMetadata | None]] = {}
 
     def list_styles(self) -> list[StyleMetadata]:
         """
@@ -64,16 +66,16 @@ class StyleLoader:
         # Load library styles
         if self.library_path.exists():
             for path in self.library_path.glob("*.yaml"):
-                style = self._load_style_file(path)
-                if style:
-                    styles[style.name] = StyleMetadata.from_style(style)
+                metadata = self._file_metadata(path)
+                if metadata:
+                    styles[metadata.name] = metadata
 
         # Load project styles (override library)
         if self.project_path and self.project_path.exists():
             for path in self.project_path.glob("*.yaml"):
-                style = self._load_style_file(path)
-                if style:
-                    styles[style.name] = StyleMetadata.from_style(style)
+                metadata = self._file_metadata(path)
+                if metadata:
+                    styles[metadata.name] = metadata
 
         return list(styles.values())
 
@@ -146,6 +148,18 @@ class StyleLoader:
 
         return dest_file
 
+    def _file_metadata(self, path: Path) -> StyleMetadata | None:
+        """Listing metadata for a style file, re-parsed only when it changes."""
+        mtime = path.stat().st_mtime_ns
+        cached = self._listing.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        style = self._load_style_file(path)
+        metadata = StyleMetadata.from_style(style) if style else None
+        self._listing[path] = (mtime, metadata)
+        return metadata
+
     def _load_style_file(self, path: Path) -> Style | None:
         """Load a style from a YAML file."""
         try:
@@ -260,3 +274,4 @@ class StyleLoader:
     def clear_cache(self) -> None:
         """Clear the style cache."""
         self._cache.clear()
+        self._listing.clear()
@@ -7,8 +7,10 @@ concrete constraints and pattern suggestions.
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from enum import Enum
+from operator import attrgetter
 
 from chuk_mcp_music.models.arrangement import EnergyLevel, LayerRole
 from chuk_mcp_music.models.pattern import Pattern
@@ -17,6 +19,7 @@ from chuk_mcp_music.models.style import (
     LayerHint,
     PercussionDensity,
     Style,
+    wildcard_matcher,
 )
 
 
@@ -27,7 +30,7 @@ class ViolationSeverity(str, Enum):
     ERROR = "error"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StyleViolation:
     """A style constraint violation."""
 
@@ -36,7 +39,7 @@ class StyleViolation:
     element: str  # What was violated (pattern, tempo, etc.)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PatternSuggestion:
     """A pattern suggestion with relevance score."""
 
@@ -45,6 +48,9 @@ class PatternSuggestion:
     reason: str
 
 
+_SCORE_KEY = attrgetter("score")
+
+
 class StyleResolver:
     """
     Resolves semantic tokens using style constraints.
@@ -63,6 +69,9 @@ class StyleResolver:
             style: The style to use for resolution
         """
         self.style = style
+        # Wildcard matchers resolved once per resolver
+        self._is_forbidden = wildcard_matcher(style.forbidden.patterns)
+        self._avoided_by_role: dict[LayerRole, Callable[[str], bool]] = {}
 
     def resolve_energy(self, energy: str | EnergyLevel) -> EnergyConstraints:
         """
@@ -91,75 +100,79 @@ class StyleResolver:
 
     def suggest_patterns(
         self,
-        available_patterns: list[Pattern],
+        available_patterns: Iterable[Pattern] | None,
         role: LayerRole,
         energy: str | EnergyLevel | None = None,
+        *,
+        patterns_by_role: Mapping[LayerRole, Sequence[Pattern]] | None = None,
     ) -> list[PatternSuggestion]:
         """
         Get style-appropriate patterns for a role.
 
         Args:
-            available_patterns: Patterns to consider
+            available_patterns: Patterns to consider, or None when
+                patterns_by_role is given
             role: Layer role
             energy: Optional energy level for additional filtering
+            patterns_by_role: Patterns pre-bucketed by role, used instead of
+                available_patterns; only the bucket for this role is considered
 
         Returns:
             Sorted list of pattern suggestions (highest score first)
+
+        Raises:
+            ValueError: If both or neither of available_patterns and
+                patterns_by_role are given
         """
-        suggestions: list[PatternSuggestion] = []
+        # Narrow to patterns for this role
+        if available_patterns is not None and patterns_by_role is not None:
+            raise ValueError("Pass only one of available_patterns and patterns_by_role")
+        if patterns_by_role is not None:
+            candidates: Iterable[Pattern] = patterns_by_role.get(role, ())
+        elif available_patterns is not None:
+            candidates = [p for p in available_patterns if p.role == role]
+        else:
+            raise ValueError("Pass available_patterns or patterns_by_role")
+
         hint = self.get_layer_hint(role)
 
-        for pattern in available_patterns:
-            # Skip patterns for wrong role
-            if pattern.role != role:
-                continue
-
-            pattern_id = f"{pattern.role.value}/{pattern.name}"
-
-            # Check if forbidden
-            if self.style.is_pattern_forbidden(pattern_id):
-                continue
-
-            # Check if avoided
-            if self.style.is_pattern_avoided(pattern_id, role):
-                continue
-
-            # Calculate score
-            score = 0.5  # Base score
-
-            # Bonus for suggested patterns
-            if self.style.is_pattern_suggested(pattern_id, role):
-                score += 0.3
-                reason = "Suggested for this style"
-            else:
-                reason = "Compatible with style"
-
-            # Consider register preference
-            if hint.pitch_register and pattern.constraints:
-                # This would need pattern metadata about register
-                pass
-
-            # Consider density preference for energy
-            if energy:
-                constraints = self.resolve_energy(energy)
-                # Higher energy = prefer denser patterns
-                if (
-                    constraints.percussion == PercussionDensity.FULL
-                    and len(pattern.template.events) > 8
-                ):
+        # Resolve style decisions once per call rather than per pattern
+        is_forbidden = self._is_forbidden
+        is_avoided = wildcard_matcher(hint.avoid)
+        is_suggested = wildcard_matcher(hint.suggested)
+
+        # Higher energy = prefer denser patterns
+        prefer_dense = False
+        if energy:
+            prefer_dense = self.resolve_energy(energy).percussion == PercussionDensity.FULL
+
+        def scored() -> Iterator[PatternSuggestion]:
+            for pattern in candidates:
+                pattern_id = pattern.pattern_id
+
+                # Skip forbidden and avoided patterns
+                if is_forbidden(pattern_id) or is_avoided(pattern_id):
+                    continue
+
+                # Base score, with bonus for suggested patterns (max 0.9, so no clamp)
+                score = 0.5
+                if is_suggested(pattern_id):
+                    score += 0.3
+                    reason = "Suggested for this style"
+                else:
+                    reason = "Compatible with style"
+
+                if prefer_dense and pattern.template.is_dense:
                     score += 0.1
 
-            suggestions.append(
-                PatternSuggestion(
+                yield PatternSuggestion(
                     pattern_id=pattern_id,
-                    score=min(1.0, score),
+                    score=score,
                     reason=reason,
                 )
-            )
 
-        # Sort by score descending
-        suggestions.sort(key=lambda s: s.score, reverse=True)
-        return suggestions
+        # Sort by score descending (stable for equal scores)
+        return sorted(scored(), key=_SCORE_KEY, reverse=True)
 
     def validate_pattern(
         self,
@@ -177,10 +190,10 @@ class StyleResolver:
             List of violations (empty if valid)
         """
         violations: list[StyleViolation] = []
-        pattern_id = f"{pattern.role.value}/{pattern.name}"
+        pattern_id = pattern.pattern_id
 
         # Check if forbidden
-        if self.style.is_pattern_forbidden(pattern_id):
+        if self._is_forbidden(pattern_id):
             violations.append(
                 StyleViolation(
                     message=f"Pattern '{pattern_id}' is forbidden by style '{self.style.name}'",
@@ -190,7 +203,12 @@ class StyleResolver:
             )
 
         # Check if avoided (warning only)
-        if self.style.is_pattern_avoided(pattern_id, role):
+        is_avoided = self._avoided_by_role.get(role)
+        if is_avoided is None:
+            is_avoided = self._avoided_by_role[role] = wildcard_matcher(
+                self.get_layer_hint(role).avoid
+            )
+        if is_avoided(pattern_id):
             violations.append(
                 StyleViolation(
                     message=f"Pattern '{pattern_id}' is discouraged for '{role.value}' in style '{self.style.name}'",
@@ -211,6 +229,25 @@ class StyleResolver:
 
         return violations
 
+    def validate_patterns(
+        self,
+        uses: Iterable[tuple[Pattern, LayerRole]],
+    ) -> list[StyleViolation]:
+        """
+        Check several pattern uses against style constraints.
+
+        Args:
+            uses: (pattern, role it's being used for) pairs
+
+        Returns:
+            Violations for all uses, in order (empty if all valid)
+        """
+        violations: list[StyleViolation] = []
+        validate = self.validate_pattern
+        for pattern, role in uses:
+            violations.extend(validate(pattern, role))
+        return violations
+
     def validate_tempo(self, tempo: int) -> list[StyleViolation]:
         """
         Validate tempo against style constraints.
@@ -251,12 +288,13 @@ class StyleResolver:
         """
         violations: list[StyleViolation] = []
         hints = self.style.structure_hints
+        style_name = self.style.name
 
         # Check breakdown requirement
         if hints.breakdown_required and not has_breakdown:
             violations.append(
                 StyleViolation(
-                    message=f"Style '{self.style.name}' typically includes a breakdown section",
+                    message=f"Style '{style_name}' typically includes a breakdown section",
                     severity=ViolationSeverity.WARNING,
                     element="structure",
                 )
@@ -268,22 +306,23 @@ class StyleResolver:
         if total_bars < min_bars or total_bars > max_bars:
             violations.append(
                 StyleViolation(
-                    message=f"Total length ({total_bars} bars) outside typical range [{min_bars}-{max_bars}] for style '{self.style.name}'",
+                    message=f"Total length ({total_bars} bars) outside typical range [{min_bars}-{max_bars}] for style '{style_name}'",
                     severity=ViolationSeverity.WARNING,
                     element="structure",
                 )
             )
 
         # Check section multiples
-        for section, bars in section_bars.items():
-            if bars % hints.section_multiples != 0:
-                violations.append(
-                    StyleViolation(
-                        message=f"Section '{section}' ({bars} bars) is not a multiple of {hints.section_multiples}",
-                        severity=ViolationSeverity.WARNING,
-                        element=f"section:{section}",
-                    )
-                )
+        multiple = hints.section_multiples
+        violations.extend(
+            StyleViolation(
+                message=f"Section '{section}' ({bars} bars) is not a multiple of {multiple}",
+                severity=ViolationSeverity.WARNING,
+                element=f"section:{section}",
+            )
+            for section, bars in section_bars.items()
+            if bars % multiple
+        )
 
         return violations
 
@@ -6,17 +6,14 @@ Tools for creating, managing, and querying arrangements.
 
 from __future__ import annotations
 
-import json
-import logging
 from typing import TYPE_CHECKING, Any
 
 from chuk_mcp_music.arrangement import ArrangementManager
+from chuk_mcp_music.tools.responses import not_found, success, tool_response
 
 if TYPE_CHECKING:
     from chuk_mcp_server import ChukMCPServer
 
-logger = logging.getLogger(__name__)
-
 
 def register_arrangement_tools(
     mcp: ChukMCPServer,
@@ -32,9 +29,9 @@ def register_arrangement_tools(
     Returns:
         Dictionary of registered tool functions
     """
-    tools: dict[str, Any] = {}
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to create arrangement")
     async def music_create_arrangement(
         name: str,
         key: str,
@@ -66,37 +63,18 @@ def register_arrangement_tools(
                 style="melodic-techno"
             )
         """
-        try:
-            arrangement = await manager.create(
-                name=name,
-                key=key,
-                tempo=tempo,
-                time_signature=time_signature,
-                style=style,
-            )
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "arrangement": {
-                        "name": arrangement.name,
-                        "key": arrangement.context.key,
-                        "tempo": arrangement.context.tempo,
-                        "time_signature": arrangement.context.time_signature,
-                        "style": arrangement.context.style,
-                        "total_bars": arrangement.total_bars(),
-                        "sections": len(arrangement.sections),
-                        "layers": len(arrangement.layers),
-                    },
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to create arrangement")
-            return json.dumps({"status": "error", "message": str(e)})
+        arrangement = await manager.create(
+            name=name,
+            key=key,
+            tempo=tempo,
+            time_signature=time_signature,
+            style=style,
+        )
 
-    tools["music_create_arrangement"] = music_create_arrangement
+        return success(arrangement=arrangement.summary())
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to get arrangement")
     async def music_get_arrangement(name: str) -> str:
         """
         Get arrangement details.
@@ -113,24 +91,14 @@ def register_arrangement_tools(
         Example:
             music_get_arrangement(name="my-track")
         """
-        try:
-            arrangement = await manager.get(name)
-            if arrangement is None:
-                return json.dumps({"status": "error", "message": f"Arrangement not found: {name}"})
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "arrangement": arrangement.to_yaml_dict(),
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to get arrangement")
-            return json.dumps({"status": "error", "message": str(e)})
+        arrangement = await manager.get(name)
+        if arrangement is None:
+            return not_found("Arrangement", name)
 
-    tools["music_get_arrangement"] = music_get_arrangement
+        return success(arrangement=arrangement.to_yaml_dict())
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to list arrangements")
     async def music_list_arrangements() -> str:
         """
         List all saved arrangements.
@@ -143,32 +111,12 @@ def register_arrangement_tools(
         Example:
             music_list_arrangements()
         """
-        try:
-            arrangements = await manager.list_arrangements()
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "arrangements": [
-                        {
-                            "name": arr.name,
-                            "key": arr.key,
-                            "tempo": arr.tempo,
-                            "total_bars": arr.total_bars,
-                            "layers": arr.layer_count,
-                            "modified": arr.modified.isoformat(),
-                        }
-                        for arr in arrangements
-                    ],
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to list arrangements")
-            return json.dumps({"status": "error", "message": str(e)})
+        arrangements = await manager.list_arrangements()
 
-    tools["music_list_arrangements"] = music_list_arrangements
+        return success(arrangements=[arr.as_dict for arr in arrangements])
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to save arrangement")
     async def music_save_arrangement(name: str) -> str:
         """
         Save an arrangement to disk.
@@ -185,27 +133,19 @@ def register_arrangement_tools(
         Example:
             music_save_arrangement(name="my-track")
         """
-        try:
-            arrangement = await manager.get(name)
-            if arrangement is None:
-                return json.dumps({"status": "error", "message": f"Arrangement not found: {name}"})
-
-            path = await manager.save(arrangement)
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "message": f"Arrangement saved to {path}",
-                    "path": str(path),
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to save arrangement")
-            return json.dumps({"status": "error", "message": str(e)})
+        arrangement = await manager.get(name)
+        if arrangement is None:
+            return not_found("Arrangement", name)
 
-    tools["music_save_arrangement"] = music_save_arrangement
+        path = await manager.save(arrangement)
+
+        return success(
+            message=f"Arrangement saved to {path}",
+            path=str(path),
+        )
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to delete arrangement")
     async def music_delete_arrangement(name: str) -> str:
         """
         Delete an arrangement.
@@ -221,25 +161,15 @@ def register_arrangement_tools(
         Example:
             music_delete_arrangement(name="my-track")
         """
-        try:
-            deleted = await manager.delete(name)
-
-            if deleted:
-                return json.dumps(
-                    {
-                        "status": "success",
-                        "message": f"Arrangement '{name}' deleted",
-                    }
-                )
-            else:
-                return json.dumps({"status": "error", "message": f"Arrangement not found: {name}"})
-        except Exception as e:
-            logger.exception("Failed to delete arrangement")
-            return json.dumps({"status": "error", "message": str(e)})
-
-    tools["music_delete_arrangement"] = music_delete_arrangement
+        deleted = await manager.delete(name)
+
+        if not deleted:
+            return not_found("Arrangement", name)
+
+        return success(message=f"Arrangement '{name}' deleted")
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to duplicate arrangement")
     async def music_duplicate_arrangement(name: str, new_name: str) -> str:
         """
         Duplicate an arrangement with a new name.
@@ -256,25 +186,18 @@ def register_arrangement_tools(
         Example:
             music_duplicate_arrangement(name="my-track", new_name="my-track-v2")
         """
-        try:
-            new_arrangement = await manager.duplicate(name, new_name)
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "message": f"Created duplicate: {new_name}",
-                    "arrangement": {
-                        "name": new_arrangement.name,
-                        "key": new_arrangement.context.key,
-                        "tempo": new_arrangement.context.tempo,
-                        "total_bars": new_arrangement.total_bars(),
-                    },
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to duplicate arrangement")
-            return json.dumps({"status": "error", "message": str(e)})
-
-    tools["music_duplicate_arrangement"] = music_duplicate_arrangement
-
-    return tools
+        new_arrangement = await manager.duplicate(name, new_name)
+
+        return success(
+            message=f"Created duplicate: {new_name}",
+            arrangement=new_arrangement.summary(),
+        )
+
+    return {
+        "music_create_arrangement": music_create_arrangement,
+        "music_get_arrangement": music_get_arrangement,
+        "music_list_arrangements": music_list_arrangements,
+        "music_save_arrangement": music_save_arrangement,
+        "music_delete_arrangement": music_delete_arrangement,
+        "music_duplicate_arrangement": music_duplicate_arrangement,
+    }
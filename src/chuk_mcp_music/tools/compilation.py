@@ -6,20 +6,191 @@ Tools for compiling arrangements to MIDI files.
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
+import io
 import logging
+import os
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import replace
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import orjson
+import yaml
+
 from chuk_mcp_music.arrangement import ArrangementManager
-from chuk_mcp_music.compiler import ArrangementCompiler
+from chuk_mcp_music.arrangement.validator import validate_arrangement
+from chuk_mcp_music.compiler import ArrangementCompiler, CompileResult
+from chuk_mcp_music.compiler.midi import score_ir_to_midi
+from chuk_mcp_music.compiler.score_ir import IRNote, ScoreIR
+from chuk_mcp_music.models.arrangement import Arrangement
 from chuk_mcp_music.patterns import PatternRegistry
+from chuk_mcp_music.tools.responses import log_failure, not_found, success, tool_response
 
 if TYPE_CHECKING:
     from chuk_mcp_server import ChukMCPServer
+    from mido import MidiFile
 
 logger = logging.getLogger(__name__)
 
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeDumper as YamlDumper  # type: ignore[assignment]
+
+# Number of recent compile results kept per server
+COMPILE_CACHE_SIZE = 32
+
+
+# Maximum arrangements compiled at once by music_compile_midi_batch
+BATCH_CONCURRENCY = min(8, os.cpu_count() or 4)
+
+# Number of recently parsed IR JSON strings kept
+IR_PARSE_CACHE_SIZE = 16
+
+_ir_parse_cache: OrderedDict[bytes, ScoreIR] = OrderedDict()
+
+
+def _write_midi(midi: MidiFile | CompileResult, path: Path) -> None:
+    """
+    Write a MIDI file to disk in a single write.
+
+    mido writes event by event; serializing into memory first turns
+    those many small writes into one. A CompileResult encodes its MIDI
+    lazily, so passing the result keeps that encoding in the worker thread.
+    """
+    midi_file = midi.midi_file if isinstance(midi, CompileResult) else midi
+    buf = io.BytesIO()
+    midi_file.save(file=buf)
+    path.write_bytes(buf.getbuffer())
+
+
+def _parse_score_ir(ir_json: str | dict[str, Any]) -> ScoreIR:
+    """
+    Parse a Score IR given as a JSON string or an already-decoded dict.
+
+    JSON strings are cached by content hash, since the same IR is often
+    piped through several modify/emit calls. Callers must not mutate the
+    returned IR.
+    """
+    if isinstance(ir_json, dict):
+        return ScoreIR.from_dict(ir_json)
+
+    key = hashlib.blake2b(ir_json.encode(), digest_size=16).digest()
+    score_ir = _ir_parse_cache.get(key)
+    if score_ir is not None:
+        _ir_parse_cache.move_to_end(key)
+        return score_ir
+
+    score_ir = ScoreIR.from_json(ir_json)
+    _ir_parse_cache[key] = score_ir
+    if len(_ir_parse_cache) > IR_PARSE_CACHE_SIZE:
+        _ir_parse_cache.popitem(last=False)
+    return score_ir
+
+
+def _ir_response(score_ir: ScoreIR, include_notes: bool, columnar: bool) -> str:
+    """Build the music_compile_to_ir success response, streaming the IR."""
+    buf = io.BytesIO()
+    buf.write(b'{"status":"success","score_ir":')
+    score_ir.write_json(buf, include_notes=include_notes, columnar=columnar)
+    buf.write(b',"summary":')
+    buf.write(orjson.dumps(score_ir.summary()))
+    buf.write(b"}")
+    return buf.getvalue().decode()
+
+
+def _membership_filter(
+    include: list[str] | None, exclude: list[str] | None
+) -> tuple[frozenset[str | None] | None, frozenset[str | None]]:
+    """
+    Reduce include/exclude lists to an allow set or a deny set.
+
+    Returns (allowed, denied): when an include list is given, allowed holds
+    the included names minus the excluded ones and denied is empty;
+    otherwise allowed is None and denied holds the excluded names.
+    """
+    denied: frozenset[str | None] = frozenset(exclude or ())
+    if include:
+        return frozenset(include) - denied, frozenset()
+    return None, denied
+
+
+def _modify_score_ir(
+    score_ir: ScoreIR,
+    *,
+    filter_layers: list[str] | None = None,
+    exclude_layers: list[str] | None = None,
+    filter_sections: list[str] | None = None,
+    exclude_sections: list[str] | None = None,
+    velocity_scale: float | None = None,
+    transpose: int | None = None,
+) -> ScoreIR:
+    """
+    Filter and transform a Score IR.
+
+    See music_modify_ir for the meaning of each option.
+
+    Returns:
+        A new ScoreIR named '<name>_modified'
+    """
+    # Filter by layers and sections. Excludes are folded into includes when
+    # both are given, so each note needs at most one set lookup per field
+    keep_layers, drop_layers = _membership_filter(filter_layers, exclude_layers)
+    keep_sections, drop_sections = _membership_filter(filter_sections, exclude_sections)
+    notes: Iterable[IRNote] = score_ir.notes
+    if keep_layers is not None or drop_layers or keep_sections is not None or drop_sections:
+        notes = (
+            n
+            for n in notes
+            if (
+                n.source_layer in keep_layers
+                if keep_layers is not None
+                else n.source_layer not in drop_layers
+            )
+            and (
+                n.source_section in keep_sections
+                if keep_sections is not None
+                else n.source_section not in drop_sections
+            )
+        )
+
+    # Transform velocity and pitch, fused with filtering so each
+    # surviving note is built once
+    scale = 1.0 if velocity_scale is None else max(0.0, min(2.0, velocity_scale))
+    shift = transpose or 0
+    if scale != 1.0 or shift:
+        # MIDI values are 0-127, so the clamped transforms are lookup tables
+        pitch_map = [max(0, min(127, p + shift)) for p in range(128)]
+        velocity_map = [max(0, min(127, int(v * scale))) for v in range(128)]
+
+        notes = [
+            IRNote(
+                start_ticks=n.start_ticks,
+                channel=n.channel,
+                pitch=pitch_map[n.pitch],
+                duration_ticks=n.duration_ticks,
+                velocity=velocity_map[n.velocity],
+                source_layer=n.source_layer,
+                source_pattern=n.source_pattern,
+                source_section=n.source_section,
+                bar=n.bar,
+                beat=n.beat,
+            )
+            for n in notes
+        ]
+
+    # Filter-only and no-op calls share the original IRNote objects. to_dict()
+    # canonicalizes on output, so no extra sort is needed here
+    return replace(
+        score_ir,
+        name=score_ir.name + "_modified",
+        notes=notes if isinstance(notes, list) else list(notes),
+    )
+
 
 def register_compilation_tools(
     mcp: ChukMCPServer,
@@ -39,10 +210,54 @@ def register_compilation_tools(
     Returns:
         Dictionary of registered tool functions
     """
-    tools: dict[str, Any] = {}
+    # Shared by all tools; safe for concurrent compile / compile_section
+    # calls from worker threads
     compiler = ArrangementCompiler(registry)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Keyed by arrangement content and pattern registry state, so edits to
+    # either produce a fresh compile. Entries are tasks so that concurrent
+    # requests for the same arrangement share one compile.
+    compile_cache: OrderedDict[tuple[str, str | None, str, int], asyncio.Future[CompileResult]] = (
+        OrderedDict()
+    )
+
+    def evict_failed(
+        key: tuple[str, str | None, str, int], done: asyncio.Future[CompileResult]
+    ) -> None:
+        """Drop a finished compile from the cache if it failed or was cancelled."""
+        # Checking the exception also marks it retrieved, so a failure nobody
+        # is still awaiting isn't reported as "never retrieved"
+        if (done.cancelled() or done.exception() is not None) and compile_cache.get(key) is done:
+            del compile_cache[key]
+
+    async def compile_cached(arr: Arrangement, section: str | None = None) -> CompileResult:
+        """
+        Compile an arrangement (or one section), reusing recent results.
+
+        Compilation runs in a worker thread; the cache itself is only
+        touched from the event loop. Failed compiles are not cached.
+        """
+        key = (arr.name, section, arr.fingerprint(), registry.generation)
+        pending = compile_cache.get(key)
+        if pending is not None:
+            compile_cache.move_to_end(key)
+            return await asyncio.shield(pending)
+
+        if section:
+            pending = asyncio.ensure_future(
+                asyncio.to_thread(compiler.compile_section, arr, section)
+            )
+        else:
+            pending = asyncio.ensure_future(asyncio.to_thread(compiler.compile, arr))
+        compile_cache[key] = pending
+        pending.add_done_callback(partial(evict_failed, key))
+        if len(compile_cache) > COMPILE_CACHE_SIZE:
+            compile_cache.popitem(last=False)
+        return await asyncio.shield(pending)
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to compile MIDI")
     async def music_compile_midi(
         arrangement: str,
         output_name: str | None = None,
@@ -63,44 +278,90 @@ def register_compilation_tools(
         Example:
             music_compile_midi(arrangement="my-track")
         """
-        try:
-            arr = await manager.get(arrangement)
-            if arr is None:
-                return json.dumps(
-                    {"status": "error", "message": f"Arrangement not found: {arrangement}"}
-                )
-
-            # Compile
-            result = compiler.compile(arr)
-
-            # Determine output path
-            filename = f"{output_name or arrangement}.mid"
-            output_path = output_dir / filename
-            output_dir.mkdir(parents=True, exist_ok=True)
-
-            # Save
-            result.midi_file.save(str(output_path))
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "path": str(output_path),
-                    "compilation": {
+        arr = await manager.get(arrangement)
+        if arr is None:
+            return not_found("Arrangement", arrangement)
+
+        # Compile
+        result = await compile_cached(arr)
+
+        # Determine output path
+        filename = f"{output_name or arrangement}.mid"
+        output_path = output_dir / filename
+
+        # Save
+        await asyncio.to_thread(_write_midi, result, output_path)
+
+        return success(
+            path=str(output_path),
+            compilation={
+                "total_bars": result.total_bars,
+                "total_events": result.total_events,
+                "layers": result.layers_compiled,
+                "sections": result.sections_compiled,
+            },
+            message=f"Compiled {result.total_bars} bars, {result.total_events} events",
+        )
+
+    @mcp.tool  # type: ignore[arg-type]
+    async def music_compile_midi_batch(arrangements: list[str]) -> str:
+        """
+        Compile several arrangements to MIDI files in one call.
+
+        Arrangements are compiled concurrently, a few at a time. Each is
+        written to '<name>.mid'; a failure in one does not stop the others.
+        Repeated names are compiled once.
+
+        Args:
+            arrangements: Arrangement names
+
+        Returns:
+            JSON string with a result entry per distinct arrangement, in
+            order of first appearance
+
+        Example:
+            music_compile_midi_batch(arrangements=["track-v1", "track-v2"])
+        """
+        limit = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+        async def compile_one(name: str) -> dict[str, Any]:
+            async with limit:
+                try:
+                    arr = await manager.get(name)
+                    if arr is None:
+                        return {
+                            "arrangement": name,
+                            "status": "error",
+                            "message": f"Arrangement not found: {name}",
+                        }
+
+                    result = await compile_cached(arr)
+                    output_path = output_dir / f"{name}.mid"
+                    await asyncio.to_thread(_write_midi, result, output_path)
+
+                    return {
+                        "arrangement": name,
+                        "status": "success",
+                        "path": str(output_path),
                         "total_bars": result.total_bars,
                         "total_events": result.total_events,
-                        "layers": result.layers_compiled,
-                        "sections": result.sections_compiled,
-                    },
-                    "message": f"Compiled {result.total_bars} bars, {result.total_events} events",
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to compile MIDI")
-            return json.dumps({"status": "error", "message": str(e)})
+                    }
+                except Exception as e:
+                    log_failure(logger, f"Failed to compile MIDI for {name}", e)
+                    return {"arrangement": name, "status": "error", "message": str(e)}
+
+        # Duplicates would race to write the same output file
+        results = await asyncio.gather(*(compile_one(name) for name in dict.fromkeys(arrangements)))
+        compiled = sum(r["status"] == "success" for r in results)
 
-    tools["music_compile_midi"] = music_compile_midi
+        return success(
+            results=results,
+            compiled=compiled,
+            failed=len(results) - compiled,
+        )
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to preview section", expected=(ValueError,))
     async def music_preview_section(
         arrangement: str,
         section: str,
@@ -123,45 +384,32 @@ def register_compilation_tools(
         Example:
             music_preview_section(arrangement="my-track", section="chorus")
         """
-        try:
-            arr = await manager.get(arrangement)
-            if arr is None:
-                return json.dumps(
-                    {"status": "error", "message": f"Arrangement not found: {arrangement}"}
-                )
-
-            # Compile section
-            result = compiler.compile_section(arr, section)
-
-            # Determine output path
-            filename = f"{output_name or f'{arrangement}_{section}'}.mid"
-            output_path = output_dir / filename
-            output_dir.mkdir(parents=True, exist_ok=True)
-
-            # Save
-            result.midi_file.save(str(output_path))
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "path": str(output_path),
-                    "section": section,
-                    "compilation": {
-                        "bars": result.total_bars,
-                        "events": result.total_events,
-                        "layers": result.layers_compiled,
-                    },
-                }
-            )
-        except ValueError as e:
-            return json.dumps({"status": "error", "message": str(e)})
-        except Exception as e:
-            logger.exception("Failed to preview section")
-            return json.dumps({"status": "error", "message": str(e)})
-
-    tools["music_preview_section"] = music_preview_section
+        arr = await manager.get(arrangement)
+        if arr is None:
+            return not_found("Arrangement", arrangement)
+
+        # Compile section
+        result = await compile_cached(arr, section)
+
+        # Determine output path
+        filename = f"{output_name or f'{arrangement}_{section}'}.mid"
+        output_path = output_dir / filename
+
+        # Save
+        await asyncio.to_thread(_write_midi, result, output_path)
+
+        return success(
+            path=str(output_path),
+            section=section,
+            compilation={
+                "bars": result.total_bars,
+                "events": result.total_events,
+                "layers": result.layers_compiled,
+            },
+        )
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to export YAML")
     async def music_export_yaml(arrangement: str) -> str:
         """
         Export arrangement as YAML.
@@ -178,32 +426,21 @@ def register_compilation_tools(
         Example:
             music_export_yaml(arrangement="my-track")
         """
-        try:
-            import yaml
-
-            arr = await manager.get(arrangement)
-            if arr is None:
-                return json.dumps(
-                    {"status": "error", "message": f"Arrangement not found: {arrangement}"}
-                )
-
-            yaml_dict = arr.to_yaml_dict()
-            yaml_content = yaml.safe_dump(yaml_dict, default_flow_style=False, sort_keys=False)
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "yaml": yaml_content,
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to export YAML")
-            return json.dumps({"status": "error", "message": str(e)})
+        arr = await manager.get(arrangement)
+        if arr is None:
+            return not_found("Arrangement", arrangement)
+
+        # Snapshot on the event loop, emit in a worker thread
+        yaml_dict = arr.to_yaml_dict()
+        yaml_content = await asyncio.to_thread(
+            yaml.dump, yaml_dict, Dumper=YamlDumper, default_flow_style=False, sort_keys=False
+        )
 
-    tools["music_export_yaml"] = music_export_yaml
+        return success(yaml=yaml_content)
 
     @mcp.tool  # type: ignore[arg-type]
-    async def music_validate(arrangement: str) -> str:
+    @tool_response("Failed to validate arrangement")
+    async def music_validate(arrangement: str, fail_fast: bool = False) -> str:
         """
         Validate an arrangement's structure and constraints.
 
@@ -215,48 +452,37 @@ def register_compilation_tools(
 
         Args:
             arrangement: Arrangement name
+            fail_fast: Stop at the first failing check instead of collecting
+                every issue (default False)
 
         Returns:
             JSON string with validation results
 
         Example:
             music_validate(arrangement="my-track")
+            music_validate(arrangement="my-track", fail_fast=True)
         """
-        try:
-            from chuk_mcp_music.arrangement.validator import validate_arrangement
-
-            arr = await manager.get(arrangement)
-            if arr is None:
-                return json.dumps(
-                    {"status": "error", "message": f"Arrangement not found: {arrangement}"}
-                )
-
-            result = validate_arrangement(arr)
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "valid": result.is_valid,
-                    "errors": [
-                        {"message": e.message, "severity": e.severity.value} for e in result.errors
-                    ],
-                    "warnings": [
-                        {"message": w.message, "severity": w.severity.value}
-                        for w in result.warnings
-                    ],
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to validate arrangement")
-            return json.dumps({"status": "error", "message": str(e)})
+        arr = await manager.get(arrangement)
+        if arr is None:
+            return not_found("Arrangement", arrangement)
+
+        result = validate_arrangement(arr, fail_fast=fail_fast)
 
-    tools["music_validate"] = music_validate
+        return success(
+            valid=result.is_valid,
+            errors=[{"message": e.message, "severity": e.severity.value} for e in result.errors],
+            warnings=[
+                {"message": w.message, "severity": w.severity.value} for w in result.warnings
+            ],
+        )
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to compile to IR", expected=(ValueError,))
     async def music_compile_to_ir(
         arrangement: str,
         section: str | None = None,
         include_notes: bool = True,
+        columnar: bool = False,
     ) -> str:
         """
         Compile an arrangement to Score IR for inspection.
@@ -272,6 +498,10 @@ def register_compilation_tools(
             arrangement: Arrangement name
             section: Optional section name (compile only that section)
             include_notes: Whether to include individual notes (default True)
+            columnar: Return notes as a note_columns object with one list per
+                field instead of a list of note objects (default False).
+                Much more compact for large arrangements; accepted as input
+                by music_modify_ir and music_emit_midi_from_ir.
 
         Returns:
             JSON string with Score IR
@@ -280,44 +510,22 @@ def register_compilation_tools(
             music_compile_to_ir(arrangement="my-track")
             music_compile_to_ir(arrangement="my-track", section="chorus")
             music_compile_to_ir(arrangement="my-track", include_notes=False)
+            music_compile_to_ir(arrangement="my-track", columnar=True)
         """
-        try:
-            arr = await manager.get(arrangement)
-            if arr is None:
-                return json.dumps(
-                    {"status": "error", "message": f"Arrangement not found: {arrangement}"}
-                )
-
-            # Compile to get Score IR
-            result = compiler.compile_section(arr, section) if section else compiler.compile(arr)
-
-            # Get the Score IR
-            score_ir = result.score_ir
-
-            # Build response
-            ir_dict = score_ir.to_dict()
-
-            # Optionally exclude notes for summary view
-            if not include_notes:
-                ir_dict["notes"] = []
-                ir_dict["note_count"] = score_ir.note_count()
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "score_ir": ir_dict,
-                    "summary": score_ir.summary(),
-                }
-            )
-        except ValueError as e:
-            return json.dumps({"status": "error", "message": str(e)})
-        except Exception as e:
-            logger.exception("Failed to compile to IR")
-            return json.dumps({"status": "error", "message": str(e)})
+        arr = await manager.get(arrangement)
+        if arr is None:
+            return not_found("Arrangement", arrangement)
+
+        # Compile to get Score IR
+        result = await compile_cached(arr, section)
 
-    tools["music_compile_to_ir"] = music_compile_to_ir
+        # Large IRs take a while to encode; keep that off the event loop
+        return await asyncio.to_thread(
+            _ir_response, result.score_ir, include_notes=include_notes, columnar=columnar
+        )
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to diff arrangements")
     async def music_diff_ir(
         arrangement: str,
         other_arrangement: str,
@@ -338,43 +546,28 @@ def register_compilation_tools(
         Example:
             music_diff_ir(arrangement="track-v1", other_arrangement="track-v2")
         """
-        try:
-            arr1 = await manager.get(arrangement)
-            if arr1 is None:
-                return json.dumps(
-                    {"status": "error", "message": f"Arrangement not found: {arrangement}"}
-                )
-
-            arr2 = await manager.get(other_arrangement)
-            if arr2 is None:
-                return json.dumps(
-                    {"status": "error", "message": f"Arrangement not found: {other_arrangement}"}
-                )
-
-            # Compile both
-            result1 = compiler.compile(arr1)
-            result2 = compiler.compile(arr2)
-
-            # Get diff summary
-            diff = result1.score_ir.diff_summary(result2.score_ir)
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "arrangement_a": arrangement,
-                    "arrangement_b": other_arrangement,
-                    "diff": diff,
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to diff arrangements")
-            return json.dumps({"status": "error", "message": str(e)})
+        arr1, arr2 = await asyncio.gather(manager.get(arrangement), manager.get(other_arrangement))
+        if arr1 is None:
+            return not_found("Arrangement", arrangement)
+        if arr2 is None:
+            return not_found("Arrangement", other_arrangement)
+
+        # Compile both; each compile runs in its own worker thread
+        result1, result2 = await asyncio.gather(compile_cached(arr1), compile_cached(arr2))
 
-    tools["music_diff_ir"] = music_diff_ir
+        # Get diff summary
+        diff = result1.score_ir.diff_summary(result2.score_ir)
+
+        return success(
+            arrangement_a=arrangement,
+            arrangement_b=other_arrangement,
+            diff=diff,
+        )
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to emit MIDI from IR")
     async def music_emit_midi_from_ir(
-        ir_json: str,
+        ir_json: str | dict[str, Any],
         output_name: str,
     ) -> str:
         """
@@ -386,7 +579,8 @@ def register_compilation_tools(
         3. Emit MIDI from the modified IR (this tool)
 
         Args:
-            ir_json: Score IR as JSON string (from music_compile_to_ir)
+            ir_json: Score IR as a JSON string or object (the "score_ir" field
+                from music_compile_to_ir or music_modify_ir)
             output_name: Output filename (without .mid extension)
 
         Returns:
@@ -398,39 +592,27 @@ def register_compilation_tools(
             # ... modify ir["score_ir"] ...
             music_emit_midi_from_ir(ir_json=modified_ir, output_name="modified")
         """
-        try:
-            from chuk_mcp_music.compiler.midi import score_ir_to_midi
-            from chuk_mcp_music.compiler.score_ir import ScoreIR
-
-            # Parse the IR
-            score_ir = ScoreIR.from_json(ir_json)
-
-            # Convert to MIDI
-            midi_file = score_ir_to_midi(score_ir)
-
-            # Save
-            filename = f"{output_name}.mid"
-            output_path = output_dir / filename
-            output_dir.mkdir(parents=True, exist_ok=True)
-            midi_file.save(str(output_path))
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "path": str(output_path),
-                    "summary": score_ir.summary(),
-                    "message": f"Emitted {score_ir.note_count()} notes to {filename}",
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to emit MIDI from IR")
-            return json.dumps({"status": "error", "message": str(e)})
+        # Parse the IR
+        score_ir = _parse_score_ir(ir_json)
+
+        # Convert to MIDI
+        midi_file = score_ir_to_midi(score_ir)
+
+        # Save
+        filename = f"{output_name}.mid"
+        output_path = output_dir / filename
+        await asyncio.to_thread(_write_midi, midi_file, output_path)
 
-    tools["music_emit_midi_from_ir"] = music_emit_midi_from_ir
+        return success(
+            path=str(output_path),
+            summary=score_ir.summary(),
+            message=f"Emitted {score_ir.note_count()} notes to {filename}",
+        )
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to modify IR")
     async def music_modify_ir(
-        ir_json: str,
+        ir_json: str | dict[str, Any],
         filter_layers: list[str] | None = None,
         exclude_layers: list[str] | None = None,
         filter_sections: list[str] | None = None,
@@ -448,7 +630,7 @@ def register_compilation_tools(
         - Transposing pitch
 
         Args:
-            ir_json: Score IR as JSON string
+            ir_json: Score IR as a JSON string or object
             filter_layers: Keep only these layers (by name)
             exclude_layers: Remove these layers (by name)
             filter_sections: Keep only these sections (by name)
@@ -469,97 +651,37 @@ def register_compilation_tools(
             # Transpose up an octave
             music_modify_ir(ir_json=ir, transpose=12)
         """
-        try:
-            from chuk_mcp_music.compiler.score_ir import IRNote, ScoreIR
-
-            # Parse the IR
-            score_ir = ScoreIR.from_json(ir_json)
-            notes = list(score_ir.notes)
-
-            # Filter by layers
-            if filter_layers:
-                notes = [n for n in notes if n.source_layer in filter_layers]
-            if exclude_layers:
-                notes = [n for n in notes if n.source_layer not in exclude_layers]
-
-            # Filter by sections
-            if filter_sections:
-                notes = [n for n in notes if n.source_section in filter_sections]
-            if exclude_sections:
-                notes = [n for n in notes if n.source_section not in exclude_sections]
-
-            # Transform velocity
-            if velocity_scale is not None:
-                scale = max(0.0, min(2.0, velocity_scale))
-                notes = [
-                    IRNote(
-                        start_ticks=n.start_ticks,
-                        channel=n.channel,
-                        pitch=n.pitch,
-                        duration_ticks=n.duration_ticks,
-                        velocity=max(0, min(127, int(n.velocity * scale))),
-                        source_layer=n.source_layer,
-                        source_pattern=n.source_pattern,
-                        source_section=n.source_section,
-                        bar=n.bar,
-                        beat=n.beat,
-                    )
-                    for n in notes
-                ]
-
-            # Transform pitch
-            if transpose is not None:
-                notes = [
-                    IRNote(
-                        start_ticks=n.start_ticks,
-                        channel=n.channel,
-                        pitch=max(0, min(127, n.pitch + transpose)),
-                        duration_ticks=n.duration_ticks,
-                        velocity=n.velocity,
-                        source_layer=n.source_layer,
-                        source_pattern=n.source_pattern,
-                        source_section=n.source_section,
-                        bar=n.bar,
-                        beat=n.beat,
-                    )
-                    for n in notes
-                ]
-
-            # Build modified IR
-            modified_ir = ScoreIR(
-                schema=score_ir.schema,
-                name=score_ir.name + "_modified",
-                key=score_ir.key,
-                tempo=score_ir.tempo,
-                time_signature=score_ir.time_signature,
-                ticks_per_beat=score_ir.ticks_per_beat,
-                total_ticks=score_ir.total_ticks,
-                total_bars=score_ir.total_bars,
-                notes=notes,
-                sections=score_ir.sections,
-                tempo_events=score_ir.tempo_events,
-                layers=score_ir.layers,
-            ).canonicalize()
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "score_ir": modified_ir.to_dict(),
-                    "summary": modified_ir.summary(),
-                    "modifications": {
-                        "filter_layers": filter_layers,
-                        "exclude_layers": exclude_layers,
-                        "filter_sections": filter_sections,
-                        "exclude_sections": exclude_sections,
-                        "velocity_scale": velocity_scale,
-                        "transpose": transpose,
-                    },
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to modify IR")
-            return json.dumps({"status": "error", "message": str(e)})
-
-    tools["music_modify_ir"] = music_modify_ir
-
-    return tools
+        modified_ir = _modify_score_ir(
+            _parse_score_ir(ir_json),
+            filter_layers=filter_layers,
+            exclude_layers=exclude_layers,
+            filter_sections=filter_sections,
+            exclude_sections=exclude_sections,
+            velocity_scale=velocity_scale,
+            transpose=transpose,
+        )
+
+        return success(
+            score_ir=modified_ir.to_dict(),
+            summary=modified_ir.summary(),
+            modifications={
+                "filter_layers": filter_layers,
+                "exclude_layers": exclude_layers,
+                "filter_sections": filter_sections,
+                "exclude_sections": exclude_sections,
+                "velocity_scale": velocity_scale,
+                "transpose": transpose,
+            },
+        )
+
+    return {
+        "music_compile_midi": music_compile_midi,
+        "music_compile_midi_batch": music_compile_midi_batch,
+        "music_preview_section": music_preview_section,
+        "music_export_yaml": music_export_yaml,
+        "music_validate": music_validate,
+        "music_compile_to_ir": music_compile_to_ir,
+        "music_diff_ir": music_diff_ir,
+        "music_emit_midi_from_ir": music_emit_midi_from_ir,
+        "music_modify_ir": music_modify_ir,
+    }
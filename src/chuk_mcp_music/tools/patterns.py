@@ -6,19 +6,17 @@ Tools for listing, describing, and assigning patterns to layers.
 
 from __future__ import annotations
 
-import json
-import logging
+import asyncio
 from typing import TYPE_CHECKING, Any
 
 from chuk_mcp_music.arrangement import ArrangementManager
 from chuk_mcp_music.models.arrangement import LayerRole, PatternRef
 from chuk_mcp_music.patterns import PatternRegistry
+from chuk_mcp_music.tools.responses import error, not_found, success, tool_response
 
 if TYPE_CHECKING:
     from chuk_mcp_server import ChukMCPServer
 
-logger = logging.getLogger(__name__)
-
 
 def register_pattern_tools(
     mcp: ChukMCPServer,
@@ -36,9 +34,9 @@ def register_pattern_tools(
     Returns:
         Dictionary of registered tool functions
     """
-    tools: dict[str, Any] = {}
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to list patterns")
     async def music_list_patterns(
         role: str | None = None,
         style: str | None = None,
@@ -58,34 +56,13 @@ def register_pattern_tools(
         Example:
             music_list_patterns(role="bass")
         """
-        try:
-            role_enum = LayerRole(role) if role else None
-            patterns = registry.list_patterns(role=role_enum, style=style)
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "patterns": [
-                        {
-                            "id": f"{p.role.value}/{p.name}",
-                            "name": p.name,
-                            "role": p.role.value,
-                            "description": p.description,
-                            "pitched": p.pitched,
-                            "variants": p.variants,
-                        }
-                        for p in patterns
-                    ],
-                    "count": len(patterns),
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to list patterns")
-            return json.dumps({"status": "error", "message": str(e)})
+        role_enum = LayerRole(role) if role else None
+        patterns = registry.list_pattern_summaries(role=role_enum, style=style)
 
-    tools["music_list_patterns"] = music_list_patterns
+        return success(patterns=patterns, count=len(patterns))
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to describe pattern")
     async def music_describe_pattern(pattern_id: str) -> str:
         """
         Get detailed information about a pattern.
@@ -101,63 +78,14 @@ def register_pattern_tools(
         Example:
             music_describe_pattern(pattern_id="bass/root-pulse")
         """
-        try:
-            pattern = registry.get_pattern(pattern_id)
-            if pattern is None:
-                return json.dumps(
-                    {"status": "error", "message": f"Pattern not found: {pattern_id}"}
-                )
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "pattern": {
-                        "id": pattern_id,
-                        "name": pattern.name,
-                        "role": pattern.role.value,
-                        "description": pattern.description,
-                        "version": pattern.version,
-                        "pitched": pattern.pitched,
-                        "parameters": {
-                            name: {
-                                "type": param.param_type.value,
-                                "description": param.description,
-                                "values": param.values,
-                                "range": list(param.range) if param.range else None,
-                                "default": param.default,
-                            }
-                            for name, param in pattern.parameters.items()
-                        },
-                        "variants": {
-                            name: {
-                                "description": variant.description,
-                                "params": variant.params,
-                            }
-                            for name, variant in pattern.variants.items()
-                        },
-                        "template": {
-                            "bars": pattern.template.bars,
-                            "loop": pattern.template.loop,
-                            "event_count": len(pattern.template.events),
-                        },
-                        "constraints": {
-                            "requires_harmony": pattern.constraints.requires_harmony
-                            if pattern.constraints
-                            else True,
-                            "compatible_styles": pattern.constraints.compatible_styles
-                            if pattern.constraints
-                            else None,
-                        },
-                    },
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to describe pattern")
-            return json.dumps({"status": "error", "message": str(e)})
+        pattern = registry.get_pattern(pattern_id)
+        if pattern is None:
+            return not_found("Pattern", pattern_id)
 
-    tools["music_describe_pattern"] = music_describe_pattern
+        return success(pattern={"id": pattern_id, **pattern.details})
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to add pattern")
     async def music_add_pattern(
         arrangement: str,
         layer: str,
@@ -192,68 +120,51 @@ def register_pattern_tools(
                 variant="driving"
             )
         """
-        try:
-            # Verify pattern exists
-            pattern = registry.get_pattern(pattern_id)
-            if pattern is None:
-                return json.dumps(
-                    {"status": "error", "message": f"Pattern not found: {pattern_id}"}
-                )
-
-            # Get the arrangement
-            arr = await manager.get(arrangement)
-            if arr is None:
-                return json.dumps(
-                    {"status": "error", "message": f"Arrangement not found: {arrangement}"}
-                )
-
-            layer_obj = arr.get_layer(layer)
-            if layer_obj is None:
-                return json.dumps({"status": "error", "message": f"Layer not found: {layer}"})
-
-            # Determine alias
-            pattern_alias = alias or pattern.name
-
-            # Validate variant if specified
-            if variant and pattern.variants and variant not in pattern.variants:
-                return json.dumps(
-                    {
-                        "status": "error",
-                        "message": f"Unknown variant: {variant}. Available: {list(pattern.variants.keys())}",
-                    }
-                )
-
-            # Validate params if specified
-            if params:
-                errors = pattern.validate_params(params)
-                if errors:
-                    return json.dumps({"status": "error", "message": f"Invalid params: {errors}"})
-
-            # Add to layer
-            layer_obj.patterns[pattern_alias] = PatternRef(
-                ref=pattern_id,
-                variant=variant,
-                params=params or {},
-            )
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "layer": layer,
-                    "pattern_alias": pattern_alias,
-                    "patterns": {
-                        alias: {"ref": p.ref, "variant": p.variant}
-                        for alias, p in layer_obj.patterns.items()
-                    },
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to add pattern")
-            return json.dumps({"status": "error", "message": str(e)})
-
-    tools["music_add_pattern"] = music_add_pattern
+        # Verify pattern exists
+        pattern = registry.get_pattern(pattern_id)
+        if pattern is None:
+            return not_found("Pattern", pattern_id)
+
+        # Get the arrangement
+        arr = await manager.get(arrangement)
+        if arr is None:
+            return not_found("Arrangement", arrangement)
+
+        layer_obj = arr.get_layer(layer)
+        if layer_obj is None:
+            return not_found("Layer", layer)
+
+        # Determine alias
+        pattern_alias = alias or pattern.name
+
+        # Validate variant if specified
+        if variant and pattern.variants and variant not in pattern.variants:
+            return error(f"Unknown variant: {variant}. Available: {list(pattern.variants.keys())}")
+
+        # Validate params if specified
+        if params:
+            errors = pattern.validate_params(params)
+            if errors:
+                return error(f"Invalid params: {errors}")
+
+        # Add to layer
+        layer_obj.patterns[pattern_alias] = PatternRef(
+            ref=pattern_id,
+            variant=variant,
+            params=params or {},
+        )
+
+        return success(
+            layer=layer,
+            pattern_alias=pattern_alias,
+            patterns={
+                alias: {"ref": p.ref, "variant": p.variant}
+                for alias, p in layer_obj.patterns.items()
+            },
+        )
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to remove pattern")
     async def music_remove_pattern(
         arrangement: str,
         layer: str,
@@ -277,45 +188,28 @@ def register_pattern_tools(
                 alias="main"
             )
         """
-        try:
-            arr = await manager.get(arrangement)
-            if arr is None:
-                return json.dumps(
-                    {"status": "error", "message": f"Arrangement not found: {arrangement}"}
-                )
-
-            layer_obj = arr.get_layer(layer)
-            if layer_obj is None:
-                return json.dumps({"status": "error", "message": f"Layer not found: {layer}"})
-
-            if alias not in layer_obj.patterns:
-                return json.dumps(
-                    {"status": "error", "message": f"Pattern alias not found: {alias}"}
-                )
-
-            # Remove from patterns
-            del layer_obj.patterns[alias]
-
-            # Remove from arrangement references
-            for section, pattern_alias in list(layer_obj.arrangement.items()):
-                if pattern_alias == alias:
-                    layer_obj.arrangement[section] = None
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "layer": layer,
-                    "removed": alias,
-                    "patterns": list(layer_obj.patterns.keys()),
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to remove pattern")
-            return json.dumps({"status": "error", "message": str(e)})
+        arr = await manager.get(arrangement)
+        if arr is None:
+            return not_found("Arrangement", arrangement)
+
+        layer_obj = arr.get_layer(layer)
+        if layer_obj is None:
+            return not_found("Layer", layer)
 
-    tools["music_remove_pattern"] = music_remove_pattern
+        if alias not in layer_obj.patterns:
+            return not_found("Pattern alias", alias)
+
+        # Remove the pattern and its section references
+        layer_obj.remove_pattern(alias)
+
+        return success(
+            layer=layer,
+            removed=alias,
+            patterns=list(layer_obj.patterns.keys()),
+        )
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to update pattern params")
     async def music_update_pattern_params(
         arrangement: str,
         layer: str,
@@ -345,55 +239,42 @@ def register_pattern_tools(
                 params={"velocity_base": 0.7}
             )
         """
-        try:
-            arr = await manager.get(arrangement)
-            if arr is None:
-                return json.dumps(
-                    {"status": "error", "message": f"Arrangement not found: {arrangement}"}
-                )
-
-            layer_obj = arr.get_layer(layer)
-            if layer_obj is None:
-                return json.dumps({"status": "error", "message": f"Layer not found: {layer}"})
-
-            if alias not in layer_obj.patterns:
-                return json.dumps(
-                    {"status": "error", "message": f"Pattern alias not found: {alias}"}
-                )
-
-            pattern_ref = layer_obj.patterns[alias]
-
-            # Merge params
-            new_params = dict(pattern_ref.params)
-            if params:
-                new_params.update(params)
-
-            # Create new PatternRef (frozen model)
-            layer_obj.patterns[alias] = PatternRef(
-                ref=pattern_ref.ref,
-                variant=variant if variant is not None else pattern_ref.variant,
-                params=new_params,
-            )
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "layer": layer,
-                    "pattern": {
-                        "alias": alias,
-                        "ref": layer_obj.patterns[alias].ref,
-                        "variant": layer_obj.patterns[alias].variant,
-                        "params": layer_obj.patterns[alias].params,
-                    },
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to update pattern params")
-            return json.dumps({"status": "error", "message": str(e)})
-
-    tools["music_update_pattern_params"] = music_update_pattern_params
+        arr = await manager.get(arrangement)
+        if arr is None:
+            return not_found("Arrangement", arrangement)
+
+        layer_obj = arr.get_layer(layer)
+        if layer_obj is None:
+            return not_found("Layer", layer)
+
+        if alias not in layer_obj.patterns:
+            return not_found("Pattern alias", alias)
+
+        pattern_ref = layer_obj.patterns[alias]
+
+        # PatternRef is frozen; copy it with only the changed fields,
+        # merging params rather than replacing them
+        update: dict[str, Any] = {}
+        if variant is not None:
+            update["variant"] = variant
+        if params:
+            update["params"] = {**pattern_ref.params, **params}
+        if update:
+            pattern_ref = pattern_ref.model_copy(update=update)
+            layer_obj.patterns[alias] = pattern_ref
+
+        return success(
+            layer=layer,
+            pattern={
+                "alias": alias,
+                "ref": pattern_ref.ref,
+                "variant": pattern_ref.variant,
+                "params": pattern_ref.params,
+            },
+        )
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to copy pattern", expected=(ValueError,))
     async def music_copy_pattern_to_project(pattern_id: str) -> str:
         """
         Copy a library pattern to the project for customization.
@@ -409,27 +290,26 @@ def register_pattern_tools(
         Example:
             music_copy_pattern_to_project(pattern_id="drums/four-on-floor")
         """
-        try:
-            path = registry.copy_to_project(pattern_id)
-            if path is None:
-                return json.dumps(
-                    {"status": "error", "message": f"Pattern not found: {pattern_id}"}
-                )
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "message": "Pattern copied to project",
-                    "path": str(path),
-                    "hint": "You can now customize this pattern by editing the YAML file",
-                }
-            )
-        except ValueError as e:
-            return json.dumps({"status": "error", "message": str(e)})
-        except Exception as e:
-            logger.exception("Failed to copy pattern")
-            return json.dumps({"status": "error", "message": str(e)})
-
-    tools["music_copy_pattern_to_project"] = music_copy_pattern_to_project
-
-    return tools
+        # Reading the library file and writing YAML run in worker threads;
+        # the registry's caches are only invalidated back on the event loop
+        pattern = await asyncio.to_thread(registry.get_pattern, pattern_id)
+        if pattern is None:
+            return not_found("Pattern", pattern_id)
+
+        path = await asyncio.to_thread(registry.write_project_copy, pattern)
+        registry.invalidate_pattern(pattern_id)
+
+        return success(
+            message="Pattern copied to project",
+            path=str(path),
+            hint="You can now customize this pattern by editing the YAML file",
+        )
+
+    return {
+        "music_list_patterns": music_list_patterns,
+        "music_describe_pattern": music_describe_pattern,
+        "music_add_pattern": music_add_pattern,
+        "music_remove_pattern": music_remove_pattern,
+        "music_update_pattern_params": music_update_pattern_params,
+        "music_copy_pattern_to_project": music_copy_pattern_to_project,
+    }
@@ -0,0 +1,98 @@
+"""
+Tool responses - JSON envelopes for MCP tool results.
+
+Every tool returns a JSON string with a "status" field. These helpers
+keep the envelope consistent and encode through orjson, which handles
+nested dicts, tuples, enums, and datetimes natively.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any, ParamSpec
+
+import orjson
+
+P = ParamSpec("P")
+
+
+def dumps(payload: Any) -> str:
+    """Encode a payload as a JSON string."""
+    return orjson.dumps(payload).decode()
+
+
+def success(**fields: Any) -> str:
+    """Build a success response with the given fields."""
+    return dumps({"status": "success", **fields})
+
+
+# Fixed part of every error response; only the message is encoded per call
+_ERROR_PREFIX = b'{"status":"error","message":'
+
+
+def error(message: str) -> str:
+    """Build an error response with a message."""
+    return (_ERROR_PREFIX + orjson.dumps(message) + b"}").decode()
+
+
+@functools.cache
+def _not_found_prefix(kind: str) -> bytes:
+    """Encoded error envelope up to the name, minus the closing quote."""
+    return _ERROR_PREFIX + orjson.dumps(f"{kind} not found: ")[:-1]
+
+
+def not_found(kind: str, name: str) -> str:
+    """Build an error response for a missing resource."""
+    # Only the name is encoded per call; its opening quote is dropped so it
+    # continues the cached message string
+    return (_not_found_prefix(kind) + orjson.dumps(name)[1:] + b"}").decode()
+
+
+def log_failure(log: logging.Logger, message: str, exc: BaseException) -> None:
+    """
+    Log a failed tool call.
+
+    The traceback is only formatted when DEBUG logging is enabled; otherwise
+    the message and exception text are logged as a single error line.
+    """
+    log.error("%s: %s", message, exc, exc_info=log.isEnabledFor(logging.DEBUG))
+
+
+def tool_response(
+    failure: str,
+    expected: tuple[type[Exception], ...] = (),
+) -> Callable[[Callable[P, Awaitable[str]]], Callable[P, Awaitable[str]]]:
+    """
+    Decorate a tool so exceptions become error responses.
+
+    Unexpected exceptions are logged under the tool module's logger (see
+    log_failure); in every case the message is returned to the client.
+
+    Args:
+        failure: Log message used when the tool raises
+        expected: Exception types that signal bad input; these are
+            returned as errors without being logged
+
+    Example:
+        @mcp.tool
+        @tool_response("Failed to get arrangement")
+        async def music_get_arrangement(name: str) -> str: ...
+    """
+
+    def decorator(fn: Callable[P, Awaitable[str]]) -> Callable[P, Awaitable[str]]:
+        log = logging.getLogger(fn.__module__)
+
+        @functools.wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> str:
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                if not isinstance(e, expected):
+                    log_failure(log, failure, e)
+                return error(str(e))
+
+        return wrapper
+
+    return decorator
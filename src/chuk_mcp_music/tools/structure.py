@@ -6,17 +6,41 @@ Tools for managing sections, structure, and layer arrangement.
 
 from __future__ import annotations
 
-import json
-import logging
 from typing import TYPE_CHECKING, Any
 
 from chuk_mcp_music.arrangement import ArrangementManager
-from chuk_mcp_music.models.arrangement import EnergyLevel
+from chuk_mcp_music.models.arrangement import Arrangement, EnergyLevel
+from chuk_mcp_music.tools.responses import dumps, error, success, tool_response
 
 if TYPE_CHECKING:
     from chuk_mcp_server import ChukMCPServer
 
-logger = logging.getLogger(__name__)
+# Energy levels by token, so tool input is checked with one dict lookup
+_ENERGY_BY_VALUE = {level.value: level for level in EnergyLevel}
+
+
+def _section_list(arr: Arrangement) -> list[dict[str, Any]]:
+    """Sections as listed in add-section responses."""
+    # Enums are left to orjson, which encodes them by value natively
+    return [{"name": s.name, "bars": s.bars, "energy": s.energy} for s in arr.sections]
+
+
+def _layer_list(arr: Arrangement) -> list[dict[str, Any]]:
+    """Layers as listed in add-layer responses."""
+    return [
+        {"name": lname, "role": layer.role, "channel": layer.channel}
+        for lname, layer in arr.layers.items()
+    ]
+
+
+def _layer_setting(layer: str, field: str, value: bool | float) -> str:
+    """
+    Success response for a single layer mix setting.
+
+    Formatted straight into the envelope; only the layer name and value
+    go through the encoder.
+    """
+    return f'{{"status":"success","layer":{dumps(layer)},"{field}":{dumps(value)}}}'
 
 
 def register_structure_tools(
@@ -33,9 +57,9 @@ def register_structure_tools(
     Returns:
         Dictionary of registered tool functions
     """
-    tools: dict[str, Any] = {}
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to add section", expected=(ValueError,))
     async def music_add_section(
         arrangement: str,
         name: str,
@@ -67,36 +91,47 @@ def register_structure_tools(
                 energy="medium"
             )
         """
-        try:
-            arr = await manager.add_section(
-                name=arrangement,
-                section_name=name,
-                bars=bars,
-                energy=energy,
-                position=position,
-            )
+        arr = await manager.add_section(
+            name=arrangement,
+            section_name=name,
+            bars=bars,
+            energy=energy,
+            position=position,
+        )
 
-            return json.dumps(
-                {
-                    "status": "success",
-                    "sections": [
-                        {
-                            "name": s.name,
-                            "bars": s.bars,
-                            "energy": s.energy.value if s.energy else None,
-                        }
-                        for s in arr.sections
-                    ],
-                    "total_bars": arr.total_bars(),
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to add section")
-            return json.dumps({"status": "error", "message": str(e)})
+        return success(sections=_section_list(arr), total_bars=arr.total_bars())
+
+    @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to add sections", expected=(ValueError,))
+    async def music_add_sections(arrangement: str, sections: list[dict[str, Any]]) -> str:
+        """
+        Add several sections to an arrangement in one call.
 
-    tools["music_add_section"] = music_add_section
+        Sections are appended in order. If any section is invalid, none
+        are added.
+
+        Args:
+            arrangement: Arrangement name
+            sections: Sections as objects with 'name', 'bars' and optional 'energy'
+
+        Returns:
+            JSON string with updated arrangement sections
+
+        Example:
+            music_add_sections(
+                arrangement="my-track",
+                sections=[
+                    {"name": "intro", "bars": 8, "energy": "low"},
+                    {"name": "verse", "bars": 16},
+                    {"name": "chorus", "bars": 16, "energy": "high"}
+                ]
+            )
+        """
+        arr = await manager.add_sections(name=arrangement, sections=sections)
+        return success(sections=_section_list(arr), total_bars=arr.total_bars())
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to remove section", expected=(ValueError,))
     async def music_remove_section(arrangement: str, name: str) -> str:
         """
         Remove a section from an arrangement.
@@ -111,32 +146,16 @@ def register_structure_tools(
         Example:
             music_remove_section(arrangement="my-track", name="breakdown")
         """
-        try:
-            arr = await manager.get(arrangement)
-            if arr is None:
-                return json.dumps(
-                    {"status": "error", "message": f"Arrangement not found: {arrangement}"}
-                )
-
-            removed = arr.remove_section(name)
-            if not removed:
-                return json.dumps({"status": "error", "message": f"Section not found: {name}"})
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "message": f"Removed section: {name}",
-                    "sections": [s.name for s in arr.sections],
-                    "total_bars": arr.total_bars(),
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to remove section")
-            return json.dumps({"status": "error", "message": str(e)})
+        arr = await manager.remove_section(arrangement, name)
 
-    tools["music_remove_section"] = music_remove_section
+        return success(
+            message=f"Removed section: {name}",
+            sections=[s.name for s in arr.sections],
+            total_bars=arr.total_bars(),
+        )
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to reorder sections", expected=(ValueError,))
     async def music_reorder_sections(arrangement: str, order: list[str]) -> str:
         """
         Reorder sections in an arrangement.
@@ -154,37 +173,15 @@ def register_structure_tools(
                 order=["intro", "chorus", "verse", "outro"]
             )
         """
-        try:
-            arr = await manager.get(arrangement)
-            if arr is None:
-                return json.dumps(
-                    {"status": "error", "message": f"Arrangement not found: {arrangement}"}
-                )
-
-            # Validate all section names exist
-            section_names = {s.name for s in arr.sections}
-            for name in order:
-                if name not in section_names:
-                    return json.dumps({"status": "error", "message": f"Section not found: {name}"})
-
-            # Reorder by rebuilding the list
-            section_map = {s.name: s for s in arr.sections}
-            arr.sections = [section_map[name] for name in order]
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "sections": [s.name for s in arr.sections],
-                    "total_bars": arr.total_bars(),
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to reorder sections")
-            return json.dumps({"status": "error", "message": str(e)})
+        arr = await manager.reorder_sections(arrangement, order)
 
-    tools["music_reorder_sections"] = music_reorder_sections
+        return success(
+            sections=order,
+            total_bars=arr.total_bars(),
+        )
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to set section energy", expected=(ValueError,))
     async def music_set_section_energy(
         arrangement: str,
         section: str,
@@ -211,45 +208,21 @@ def register_structure_tools(
                 energy="high"
             )
         """
-        try:
-            arr = await manager.get(arrangement)
-            if arr is None:
-                return json.dumps(
-                    {"status": "error", "message": f"Arrangement not found: {arrangement}"}
-                )
-
-            section_obj = arr.get_section(section)
-            if section_obj is None:
-                return json.dumps({"status": "error", "message": f"Section not found: {section}"})
-
-            # Sections are frozen, so we need to replace
-            for i, s in enumerate(arr.sections):
-                if s.name == section:
-                    from chuk_mcp_music.models.arrangement import Section
-
-                    arr.sections[i] = Section(
-                        name=s.name,
-                        bars=s.bars,
-                        energy=EnergyLevel(energy),
-                    )
-                    break
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "section": {
-                        "name": section,
-                        "energy": energy,
-                    },
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to set section energy")
-            return json.dumps({"status": "error", "message": str(e)})
+        energy_level = _ENERGY_BY_VALUE.get(energy)
+        if energy_level is None:
+            return error(f"Unknown energy level: {energy}. Available: {list(_ENERGY_BY_VALUE)}")
+
+        await manager.set_section_energy(arrangement, section, energy_level)
 
-    tools["music_set_section_energy"] = music_set_section_energy
+        return success(
+            section={
+                "name": section,
+                "energy": energy,
+            },
+        )
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to add layer", expected=(ValueError,))
     async def music_add_layer(
         arrangement: str,
         name: str,
@@ -278,34 +251,44 @@ def register_structure_tools(
                 role="drums"
             )
         """
-        try:
-            arr = await manager.add_layer(
-                name=arrangement,
-                layer_name=name,
-                role=role,
-                channel=channel,
-            )
+        arr = await manager.add_layer(
+            name=arrangement,
+            layer_name=name,
+            role=role,
+            channel=channel,
+        )
 
-            return json.dumps(
-                {
-                    "status": "success",
-                    "layers": [
-                        {
-                            "name": lname,
-                            "role": layer.role.value,
-                            "channel": layer.channel,
-                        }
-                        for lname, layer in arr.layers.items()
-                    ],
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to add layer")
-            return json.dumps({"status": "error", "message": str(e)})
+        return success(layers=_layer_list(arr))
 
-    tools["music_add_layer"] = music_add_layer
+    @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to add layers", expected=(ValueError,))
+    async def music_add_layers(arrangement: str, layers: list[dict[str, Any]]) -> str:
+        """
+        Add several layers to an arrangement in one call.
+
+        If any layer is invalid, none are added.
+
+        Args:
+            arrangement: Arrangement name
+            layers: Layers as objects with 'name', 'role' and optional 'channel'
+
+        Returns:
+            JSON string with updated layers
+
+        Example:
+            music_add_layers(
+                arrangement="my-track",
+                layers=[
+                    {"name": "drums", "role": "drums"},
+                    {"name": "bass", "role": "bass", "channel": 1}
+                ]
+            )
+        """
+        arr = await manager.add_layers(name=arrangement, layers=layers)
+        return success(layers=_layer_list(arr))
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to remove layer", expected=(ValueError,))
     async def music_remove_layer(arrangement: str, name: str) -> str:
         """
         Remove a layer from an arrangement.
@@ -320,31 +303,15 @@ def register_structure_tools(
         Example:
             music_remove_layer(arrangement="my-track", name="drums")
         """
-        try:
-            arr = await manager.get(arrangement)
-            if arr is None:
-                return json.dumps(
-                    {"status": "error", "message": f"Arrangement not found: {arrangement}"}
-                )
-
-            removed = arr.remove_layer(name)
-            if not removed:
-                return json.dumps({"status": "error", "message": f"Layer not found: {name}"})
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "message": f"Removed layer: {name}",
-                    "layers": list(arr.layers.keys()),
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to remove layer")
-            return json.dumps({"status": "error", "message": str(e)})
+        arr = await manager.remove_layer(arrangement, name)
 
-    tools["music_remove_layer"] = music_remove_layer
+        return success(
+            message=f"Removed layer: {name}",
+            layers=list(arr.layers.keys()),
+        )
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to arrange layer", expected=(ValueError,))
     async def music_arrange_layer(
         arrangement: str,
         layer: str,
@@ -376,31 +343,20 @@ def register_structure_tools(
                 }
             )
         """
-        try:
-            arr = await manager.arrange_layer(
-                name=arrangement,
-                layer_name=layer,
-                section_patterns=section_patterns,
-            )
-
-            layer_obj = arr.get_layer(layer)
-            if layer_obj is None:
-                return json.dumps({"status": "error", "message": f"Layer not found: {layer}"})
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "layer": layer,
-                    "arrangement": layer_obj.arrangement,
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to arrange layer")
-            return json.dumps({"status": "error", "message": str(e)})
-
-    tools["music_arrange_layer"] = music_arrange_layer
+        arr = await manager.arrange_layer(
+            name=arrangement,
+            layer_name=layer,
+            section_patterns=section_patterns,
+        )
+
+        # The manager has already checked that the layer exists
+        return success(
+            layer=layer,
+            arrangement=arr.layers[layer].arrangement,
+        )
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to mute layer", expected=(ValueError,))
     async def music_mute_layer(arrangement: str, name: str, muted: bool = True) -> str:
         """
         Mute or unmute a layer.
@@ -418,33 +374,11 @@ def register_structure_tools(
         Example:
             music_mute_layer(arrangement="my-track", name="drums", muted=True)
         """
-        try:
-            arr = await manager.get(arrangement)
-            if arr is None:
-                return json.dumps(
-                    {"status": "error", "message": f"Arrangement not found: {arrangement}"}
-                )
-
-            layer = arr.get_layer(name)
-            if layer is None:
-                return json.dumps({"status": "error", "message": f"Layer not found: {name}"})
-
-            layer.muted = muted
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "layer": name,
-                    "muted": layer.muted,
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to mute layer")
-            return json.dumps({"status": "error", "message": str(e)})
-
-    tools["music_mute_layer"] = music_mute_layer
+        layer = await manager.update_layer(arrangement, name, muted=muted)
+        return _layer_setting(name, "muted", layer.muted)
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to solo layer", expected=(ValueError,))
     async def music_solo_layer(arrangement: str, name: str, solo: bool = True) -> str:
         """
         Solo or unsolo a layer.
@@ -462,33 +396,11 @@ def register_structure_tools(
         Example:
             music_solo_layer(arrangement="my-track", name="bass", solo=True)
         """
-        try:
-            arr = await manager.get(arrangement)
-            if arr is None:
-                return json.dumps(
-                    {"status": "error", "message": f"Arrangement not found: {arrangement}"}
-                )
-
-            layer = arr.get_layer(name)
-            if layer is None:
-                return json.dumps({"status": "error", "message": f"Layer not found: {name}"})
-
-            layer.solo = solo
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "layer": name,
-                    "solo": layer.solo,
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to solo layer")
-            return json.dumps({"status": "error", "message": str(e)})
-
-    tools["music_solo_layer"] = music_solo_layer
+        layer = await manager.update_layer(arrangement, name, solo=solo)
+        return _layer_setting(name, "solo", layer.solo)
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to set layer level", expected=(ValueError,))
     async def music_set_layer_level(arrangement: str, name: str, level: float) -> str:
         """
         Set the volume level for a layer.
@@ -506,33 +418,15 @@ def register_structure_tools(
         Example:
             music_set_layer_level(arrangement="my-track", name="harmony", level=0.7)
         """
-        try:
-            arr = await manager.get(arrangement)
-            if arr is None:
-                return json.dumps(
-                    {"status": "error", "message": f"Arrangement not found: {arrangement}"}
-                )
-
-            layer = arr.get_layer(name)
-            if layer is None:
-                return json.dumps({"status": "error", "message": f"Layer not found: {name}"})
-
-            layer.level = max(0.0, min(2.0, level))
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "layer": name,
-                    "level": layer.level,
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to set layer level")
-            return json.dumps({"status": "error", "message": str(e)})
-
-    tools["music_set_layer_level"] = music_set_layer_level
+        # Clamp to the 0-2 range the Layer model allows (NaN ends up at 2.0,
+        # as with max/min)
+        if not 0.0 <= level <= 2.0:
+            level = 0.0 if level < 0.0 else 2.0
+        layer = await manager.update_layer(arrangement, name, level=level)
+        return _layer_setting(name, "level", layer.level)
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to set harmony", expected=(ValueError,))
     async def music_set_harmony(
         arrangement: str,
         section: str | None,
@@ -562,26 +456,31 @@ def register_structure_tools(
                 harmonic_rhythm="1bar"
             )
         """
-        try:
-            await manager.set_harmony(
-                name=arrangement,
-                section_name=section,
-                progression=progression,
-                harmonic_rhythm=harmonic_rhythm,
-            )
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "section": section or "default",
-                    "progression": progression,
-                    "harmonic_rhythm": harmonic_rhythm,
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to set harmony")
-            return json.dumps({"status": "error", "message": str(e)})
-
-    tools["music_set_harmony"] = music_set_harmony
-
-    return tools
+        await manager.set_harmony(
+            name=arrangement,
+            section_name=section,
+            progression=progression,
+            harmonic_rhythm=harmonic_rhythm,
+        )
+
+        return success(
+            section=section or "default",
+            progression=progression,
+            harmonic_rhythm=harmonic_rhythm,
+        )
+
+    return {
+        "music_add_section": music_add_section,
+        "music_add_sections": music_add_sections,
+        "music_remove_section": music_remove_section,
+        "music_reorder_sections": music_reorder_sections,
+        "music_set_section_energy": music_set_section_energy,
+        "music_add_layer": music_add_layer,
+        "music_add_layers": music_add_layers,
+        "music_remove_layer": music_remove_layer,
+        "music_arrange_layer": music_arrange_layer,
+        "music_mute_layer": music_mute_layer,
+        "music_solo_layer": music_solo_layer,
+        "music_set_layer_level": music_set_layer_level,
+        "music_set_harmony": music_set_harmony,
+    }
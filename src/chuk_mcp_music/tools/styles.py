@@ -7,19 +7,21 @@ arrangements against style constraints.
 
 from __future__ import annotations
 
-import json
-import logging
 from typing import TYPE_CHECKING, Any
 
 from chuk_mcp_music.arrangement import ArrangementManager
 from chuk_mcp_music.models.arrangement import LayerRole
 from chuk_mcp_music.patterns import PatternRegistry
-from chuk_mcp_music.styles import StyleLoader, StyleResolver
+from chuk_mcp_music.styles import StyleLoader, StyleResolver, ViolationSeverity
+from chuk_mcp_music.tools.responses import error, not_found, success, tool_response
 
 if TYPE_CHECKING:
     from chuk_mcp_server import ChukMCPServer
 
-logger = logging.getLogger(__name__)
+    from chuk_mcp_music.models.style import Style
+
+# Layer roles by token, so tool input is checked with one dict lookup
+_ROLE_BY_VALUE = {role.value: role for role in LayerRole}
 
 
 def register_style_tools(
@@ -40,9 +42,20 @@ def register_style_tools(
     Returns:
         Dictionary of registered tool functions
     """
-    tools: dict[str, Any] = {}
+    # Encoded music_describe_style responses by style name
+    described: dict[str, tuple[Style, str]] = {}
+    # Resolvers by style name, reused while the loader returns the same style
+    resolvers: dict[str, StyleResolver] = {}
+
+    def resolver_for(style: Style) -> StyleResolver:
+        """Get a resolver for a style, reusing the last one built for it."""
+        resolver = resolvers.get(style.name)
+        if resolver is None or resolver.style is not style:
+            resolver = resolvers[style.name] = StyleResolver(style)
+        return resolver
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to list styles")
     async def music_list_styles() -> str:
         """
         List available styles.
@@ -56,31 +69,23 @@ def register_style_tools(
         Example:
             music_list_styles()
         """
-        try:
-            styles = style_loader.list_styles()
+        styles = style_loader.list_styles()
 
-            return json.dumps(
+        return success(
+            styles=[
                 {
-                    "status": "success",
-                    "styles": [
-                        {
-                            "name": s.name,
-                            "description": s.description,
-                            "tempo_range": list(s.tempo_range),
-                            "key_preference": s.key_preference.value,
-                        }
-                        for s in styles
-                    ],
-                    "count": len(styles),
+                    "name": s.name,
+                    "description": s.description,
+                    "tempo_range": s.tempo_range,
+                    "key_preference": s.key_preference,
                 }
-            )
-        except Exception as e:
-            logger.exception("Failed to list styles")
-            return json.dumps({"status": "error", "message": str(e)})
-
-    tools["music_list_styles"] = music_list_styles
+                for s in styles
+            ],
+            count=len(styles),
+        )
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to describe style")
     async def music_describe_style(name: str) -> str:
         """
         Get detailed information about a style.
@@ -96,73 +101,22 @@ def register_style_tools(
         Example:
             music_describe_style(name="melodic-techno")
         """
-        try:
-            style = style_loader.get_style(name)
-            if style is None:
-                return json.dumps({"status": "error", "message": f"Style not found: {name}"})
+        style = style_loader.get_style(name)
+        if style is None:
+            return not_found("Style", name)
 
-            return json.dumps(
-                {
-                    "status": "success",
-                    "style": {
-                        "name": style.name,
-                        "description": style.description,
-                        "tempo": {
-                            "min": style.tempo.min_bpm,
-                            "max": style.tempo.max_bpm,
-                            "default": style.tempo.default_bpm,
-                        },
-                        "key_preference": style.key_preference.value,
-                        "time_signature": style.time_signature,
-                        "energy_levels": {
-                            "lowest": {
-                                "layers": list(style.energy_mapping.lowest.layers),
-                                "percussion": style.energy_mapping.lowest.percussion.value,
-                            },
-                            "low": {
-                                "layers": list(style.energy_mapping.low.layers),
-                                "percussion": style.energy_mapping.low.percussion.value,
-                            },
-                            "medium": {
-                                "layers": list(style.energy_mapping.medium.layers),
-                                "percussion": style.energy_mapping.medium.percussion.value,
-                            },
-                            "high": {
-                                "layers": list(style.energy_mapping.high.layers),
-                                "percussion": style.energy_mapping.high.percussion.value,
-                            },
-                            "highest": {
-                                "layers": list(style.energy_mapping.highest.layers),
-                                "percussion": style.energy_mapping.highest.percussion.value,
-                            },
-                        },
-                        "layer_hints": {
-                            role: {
-                                "suggested": hint.suggested,
-                                "avoid": hint.avoid,
-                                "register": hint.pitch_register,
-                            }
-                            for role, hint in style.layer_hints.items()
-                        },
-                        "structure": {
-                            "breakdown_required": style.structure_hints.breakdown_required,
-                            "typical_bars": list(style.structure_hints.typical_length_bars),
-                            "section_multiples": style.structure_hints.section_multiples,
-                        },
-                        "forbidden": {
-                            "patterns": style.forbidden.patterns,
-                            "progressions": style.forbidden.progressions,
-                        },
-                    },
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to describe style")
-            return json.dumps({"status": "error", "message": str(e)})
+        # Loaded styles are frozen, so the response only changes when the
+        # loader hands back a different object (reload, project copy)
+        cached = described.get(name)
+        if cached is not None and cached[0] is style:
+            return cached[1]
 
-    tools["music_describe_style"] = music_describe_style
+        response = success(style={**style.details})
+        described[name] = (style, response)
+        return response
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to suggest patterns")
     async def music_suggest_patterns(
         style: str,
         role: str,
@@ -185,55 +139,35 @@ def register_style_tools(
         Example:
             music_suggest_patterns(style="melodic-techno", role="bass", energy="medium")
         """
-        try:
-            style_obj = style_loader.get_style(style)
-            if style_obj is None:
-                return json.dumps({"status": "error", "message": f"Style not found: {style}"})
-
-            role_enum = LayerRole(role)
-            resolver = StyleResolver(style_obj)
-
-            # Get all patterns for this role
-            patterns = registry.list_patterns(role=role_enum)
-            pattern_objs = [
-                p
-                for pid in [f"{role}/{pat.name}" for pat in patterns]
-                if (p := registry.get_pattern(pid)) is not None
-            ]
-
-            # Actually load the patterns
-            pattern_objs = []
-            for pat_meta in patterns:
-                pattern = registry.get_pattern(f"{role}/{pat_meta.name}")
-                if pattern:
-                    pattern_objs.append(pattern)
-
-            suggestions = resolver.suggest_patterns(
-                pattern_objs,
-                role_enum,
-                energy,
-            )
+        role_enum = _ROLE_BY_VALUE.get(role)
+        if role_enum is None:
+            return error(f"Unknown role: {role}. Available: {list(_ROLE_BY_VALUE)}")
 
-            return json.dumps(
+        style_obj = style_loader.get_style(style)
+        if style_obj is None:
+            return not_found("Style", style)
+
+        resolver = resolver_for(style_obj)
+
+        suggestions = resolver.suggest_patterns(
+            registry.patterns_for_role(role_enum),
+            role_enum,
+            energy,
+        )
+
+        return success(
+            suggestions=[
                 {
-                    "status": "success",
-                    "suggestions": [
-                        {
-                            "pattern_id": s.pattern_id,
-                            "score": s.score,
-                            "reason": s.reason,
-                        }
-                        for s in suggestions
-                    ],
+                    "pattern_id": s.pattern_id,
+                    "score": s.score,
+                    "reason": s.reason,
                 }
-            )
-        except Exception as e:
-            logger.exception("Failed to suggest patterns")
-            return json.dumps({"status": "error", "message": str(e)})
-
-    tools["music_suggest_patterns"] = music_suggest_patterns
+                for s in suggestions
+            ],
+        )
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to validate style")
     async def music_validate_style(
         arrangement: str,
         style: str,
@@ -254,57 +188,57 @@ def register_style_tools(
         Example:
             music_validate_style(arrangement="my-track", style="melodic-techno")
         """
-        try:
-            arr = await manager.get(arrangement)
-            if arr is None:
-                return json.dumps(
-                    {"status": "error", "message": f"Arrangement not found: {arrangement}"}
-                )
-
-            style_obj = style_loader.get_style(style)
-            if style_obj is None:
-                return json.dumps({"status": "error", "message": f"Style not found: {style}"})
-
-            resolver = StyleResolver(style_obj)
-            all_violations = []
-
-            # Validate tempo
-            tempo_violations = resolver.validate_tempo(arr.context.tempo)
-            all_violations.extend(tempo_violations)
-
-            # Validate structure
-            section_bars = {s.name: s.bars for s in arr.sections}
-            has_breakdown = any(s.name == "breakdown" for s in arr.sections)
-            structure_violations = resolver.validate_structure(section_bars, has_breakdown)
-            all_violations.extend(structure_violations)
-
-            # Validate patterns in each layer
-            for _layer_name, layer in arr.layers.items():
-                for _pattern_alias, pattern_ref in layer.patterns.items():
-                    pattern = registry.get_pattern(pattern_ref.ref)
-                    if pattern:
-                        pattern_violations = resolver.validate_pattern(pattern, layer.role)
-                        all_violations.extend(pattern_violations)
-
-            # Separate errors and warnings
-            errors = [v for v in all_violations if v.severity.value == "error"]
-            warnings = [v for v in all_violations if v.severity.value == "warning"]
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "valid": len(errors) == 0,
-                    "errors": [{"message": v.message, "element": v.element} for v in errors],
-                    "warnings": [{"message": v.message, "element": v.element} for v in warnings],
-                }
+        arr = await manager.get(arrangement)
+        if arr is None:
+            return not_found("Arrangement", arrangement)
+
+        style_obj = style_loader.get_style(style)
+        if style_obj is None:
+            return not_found("Style", style)
+
+        resolver = resolver_for(style_obj)
+        all_violations = []
+
+        # Validate tempo
+        tempo_violations = resolver.validate_tempo(arr.context.tempo)
+        all_violations.extend(tempo_violations)
+
+        # Validate structure
+        section_bars = {s.name: s.bars for s in arr.sections}
+        has_breakdown = "breakdown" in section_bars
+        structure_violations = resolver.validate_structure(section_bars, has_breakdown)
+        all_violations.extend(structure_violations)
+
+        # Validate patterns in each layer, resolving them in one registry call
+        uses = [
+            (pattern_ref.ref, layer.role)
+            for layer in arr.layers.values()
+            for pattern_ref in layer.patterns.values()
+        ]
+        patterns = registry.get_patterns(ref for ref, _role in uses)
+        all_violations.extend(
+            resolver.validate_patterns(
+                (pattern, role)
+                for pattern, (_ref, role) in zip(patterns, uses, strict=True)
+                if pattern is not None
             )
-        except Exception as e:
-            logger.exception("Failed to validate style")
-            return json.dumps({"status": "error", "message": str(e)})
+        )
+
+        # Separate errors and warnings, building their entries in the same pass
+        errors: list[dict[str, str]] = []
+        warnings: list[dict[str, str]] = []
+        for v in all_violations:
+            entries = errors if v.severity is ViolationSeverity.ERROR else warnings
+            entries.append({"message": v.message, "element": v.element})
 
-    tools["music_validate_style"] = music_validate_style
+        return success(
+            valid=not errors,
+            errors=errors,
+            warnings=warnings,
+        )
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to apply style")
     async def music_apply_style(
         arrangement: str,
         style: str,
@@ -325,42 +259,32 @@ def register_style_tools(
         Example:
             music_apply_style(arrangement="my-track", style="melodic-techno")
         """
-        try:
-            arr = await manager.get(arrangement)
-            if arr is None:
-                return json.dumps(
-                    {"status": "error", "message": f"Arrangement not found: {arrangement}"}
-                )
-
-            style_obj = style_loader.get_style(style)
-            if style_obj is None:
-                return json.dumps({"status": "error", "message": f"Style not found: {style}"})
-
-            # Update style reference
-            arr.context.style = style
-
-            # Adjust tempo if out of range
-            tempo_adjusted = False
-            if not style_obj.validate_tempo(arr.context.tempo):
-                arr.context.tempo = style_obj.tempo.default_bpm
-                tempo_adjusted = True
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "arrangement": arrangement,
-                    "style": style,
-                    "tempo_adjusted": tempo_adjusted,
-                    "tempo": arr.context.tempo,
-                }
-            )
-        except Exception as e:
-            logger.exception("Failed to apply style")
-            return json.dumps({"status": "error", "message": str(e)})
-
-    tools["music_apply_style"] = music_apply_style
+        arr = await manager.get(arrangement)
+        if arr is None:
+            return not_found("Arrangement", arrangement)
+
+        style_obj = style_loader.get_style(style)
+        if style_obj is None:
+            return not_found("Style", style)
+
+        # Update style reference
+        arr.context.style = style
+
+        # Adjust tempo if out of range
+        tempo_adjusted = False
+        if not style_obj.validate_tempo(arr.context.tempo):
+            arr.context.tempo = style_obj.tempo.default_bpm
+            tempo_adjusted = True
+
+        return success(
+            arrangement=arrangement,
+            style=style,
+            tempo_adjusted=tempo_adjusted,
+            tempo=arr.context.tempo,
+        )
 
     @mcp.tool  # type: ignore[arg-type]
+    @tool_response("Failed to copy style", expected=(ValueError,))
     async def music_copy_style_to_project(name: str) -> str:
         """
         Copy a library style to the project for customization.
@@ -374,25 +298,21 @@ def register_style_tools(
         Example:
             music_copy_style_to_project(name="melodic-techno")
         """
-        try:
-            path = style_loader.copy_to_project(name)
-            if path is None:
-                return json.dumps({"status": "error", "message": f"Style not found: {name}"})
-
-            return json.dumps(
-                {
-                    "status": "success",
-                    "message": "Style copied to project",
-                    "path": str(path),
-                    "hint": "You can now customize this style by editing the YAML file",
-                }
-            )
-        except ValueError as e:
-            return json.dumps({"status": "error", "message": str(e)})
-        except Exception as e:
-            logger.exception("Failed to copy style")
-            return json.dumps({"status": "error", "message": str(e)})
-
-    tools["music_copy_style_to_project"] = music_copy_style_to_project
-
-    return tools
+        path = style_loader.copy_to_project(name)
+        if path is None:
+            return not_found("Style", name)
+
+        return success(
+            message="Style copied to project",
+            path=str(path),
+            hint="You can now customize this style by editing the YAML file",
+        )
+
+    return {
+        "music_list_styles": music_list_styles,
+        "music_describe_style": music_describe_style,
+        "music_suggest_patterns": music_suggest_patterns,
+        "music_validate_style": music_validate_style,
+        "music_apply_style": music_apply_style,
+        "music_copy_style_to_project": music_copy_style_to_project,
+    }
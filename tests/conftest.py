@@ -3,18 +3,28 @@ Pytest configuration and shared fixtures.
 """
 
 import tempfile
+import uuid
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 
 
-@pytest.fixture
-def temp_dir() -> Path:
-    """Create a temporary directory for test outputs."""
+@pytest.fixture(scope="session")
+def _session_dir() -> Iterator[Path]:
+    """One temporary directory for the whole run, removed at the end."""
     with tempfile.TemporaryDirectory() as tmpdir:
         yield Path(tmpdir)
 
 
+@pytest.fixture
+def temp_dir(_session_dir: Path) -> Path:
+    """Create an empty directory for test outputs."""
+    path = _session_dir / uuid.uuid4().hex
+    path.mkdir()
+    return path
+
+
 @pytest.fixture
 def temp_midi_path(temp_dir: Path) -> Path:
     """Path for a temporary MIDI file."""
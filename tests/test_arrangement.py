@@ -8,7 +8,6 @@ Tests cover:
 - ArrangementManager operations
 """
 
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -91,6 +90,21 @@ class TestLayer:
         assert layer.get_pattern_for_section("intro") is None
         assert layer.get_pattern_for_section("unknown") is None
 
+    def test_remove_pattern(self) -> None:
+        """Removing a pattern silences the sections that used it."""
+        layer = Layer(
+            name="bass",
+            role=LayerRole.BASS,
+            patterns={
+                "main": PatternRef(ref="bass/root-pulse"),
+                "alt": PatternRef(ref="bass/walking"),
+            },
+            arrangement={"verse": "main", "chorus": "alt", "outro": "main"},
+        )
+        assert layer.remove_pattern("main") == ["verse", "outro"]
+        assert list(layer.patterns) == ["alt"]
+        assert layer.arrangement == {"verse": None, "chorus": "alt", "outro": None}
+
 
 class TestPatternRef:
     """Tests for PatternRef model."""
@@ -161,6 +175,39 @@ class TestArrangement:
         assert arrangement.total_bars() == 24
         assert arrangement.get_section("verse") is not None
 
+    def test_fingerprint(self) -> None:
+        """Fingerprint tracks content, not timestamps."""
+        arrangement = Arrangement(
+            name="test",
+            context=ArrangementContext(key="D_minor", tempo=124),
+        )
+        copy = Arrangement.from_yaml_dict(arrangement.to_yaml_dict())
+        assert copy.fingerprint() == arrangement.fingerprint()
+
+        arrangement.add_section("intro", 8)
+        assert copy.fingerprint() != arrangement.fingerprint()
+
+    def test_summary(self) -> None:
+        """Summary reflects context and structure."""
+        arrangement = Arrangement(
+            name="test",
+            context=ArrangementContext(key="D_minor", tempo=124, style="melodic-techno"),
+        )
+        arrangement.add_section("intro", 8)
+        arrangement.add_layer("drums", LayerRole.DRUMS)
+
+        summary = arrangement.summary()
+        assert summary == {
+            "name": "test",
+            "key": "D_minor",
+            "tempo": 124,
+            "time_signature": "4/4",
+            "style": "melodic-techno",
+            "total_bars": 8,
+            "sections": 1,
+            "layers": 1,
+        }
+
     def test_remove_section(self) -> None:
         """Remove a section."""
         arrangement = Arrangement(
@@ -174,6 +221,18 @@ class TestArrangement:
         assert len(arrangement.sections) == 1
         assert not arrangement.remove_section("unknown")
 
+    def test_section_index(self) -> None:
+        """Look up a section's position by name."""
+        arrangement = Arrangement(
+            name="test",
+            context=ArrangementContext(key="D_minor", tempo=124),
+        )
+        arrangement.add_section("intro", 8)
+        arrangement.add_section("verse", 16)
+
+        assert arrangement.section_index("verse") == 1
+        assert arrangement.section_index("unknown") is None
+
     def test_add_layer(self) -> None:
         """Add layers to arrangement."""
         arrangement = Arrangement(
@@ -403,21 +462,41 @@ class TestValidation:
         assert result.is_valid  # Warnings don't fail validation
         assert any(i.code == "CHANNEL_CONFLICT" for i in result.warnings)
 
+    def test_fail_fast_stops_after_first_error(self) -> None:
+        """fail_fast skips the checks after the first failing one."""
+        arrangement = Arrangement(
+            name="test",
+            context=ArrangementContext(key="D_minor", tempo=124),
+            sections=[
+                Section(name="verse", bars=16),
+                Section(name="verse", bars=8),  # Duplicate!
+            ],
+            layers={
+                "bass1": Layer(name="bass1", role=LayerRole.BASS, channel=1),
+                "bass2": Layer(name="bass2", role=LayerRole.BASS, channel=1),
+            },
+        )
+
+        full = validate_arrangement(arrangement)
+        assert any(i.code == "CHANNEL_CONFLICT" for i in full.warnings)
+
+        result = validate_arrangement(arrangement, fail_fast=True)
+        assert not result.is_valid
+        assert [i.code for i in result.errors] == ["DUPLICATE_SECTION"]
+        assert not any(i.code == "CHANNEL_CONFLICT" for i in result.warnings)
+
 
 class TestArrangementManager:
     """Tests for ArrangementManager."""
 
     @pytest.fixture
-    def temp_dir(self) -> Path:
-        """Create a temporary directory for arrangements."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
+    def manager(self, temp_dir: Path) -> ArrangementManager:
+        """A manager over an empty arrangements directory."""
+        return ArrangementManager(temp_dir)
 
     @pytest.mark.asyncio
-    async def test_create_arrangement(self, temp_dir: Path) -> None:
+    async def test_create_arrangement(self, manager: ArrangementManager) -> None:
         """Create a new arrangement."""
-        manager = ArrangementManager(temp_dir)
-
         arrangement = await manager.create(
             name="test",
             key="D_minor",
@@ -429,10 +508,8 @@ class TestArrangementManager:
         assert arrangement.context.tempo == 124
 
     @pytest.mark.asyncio
-    async def test_save_and_load(self, temp_dir: Path) -> None:
+    async def test_save_and_load(self, manager: ArrangementManager) -> None:
         """Save and load an arrangement."""
-        manager = ArrangementManager(temp_dir)
-
         # Create and modify
         arrangement = await manager.create(name="test", key="D_minor", tempo=124)
         arrangement.add_section("intro", 8)
@@ -452,10 +529,31 @@ class TestArrangementManager:
         assert "drums" in loaded.layers
 
     @pytest.mark.asyncio
-    async def test_list_arrangements(self, temp_dir: Path) -> None:
-        """List arrangements in directory."""
-        manager = ArrangementManager(temp_dir)
+    async def test_reload_ignores_unsaved_nested_edits(self, manager: ArrangementManager) -> None:
+        """Unsaved edits to nested pattern params don't leak into later reloads."""
+        arrangement = await manager.create(name="test", key="D_minor", tempo=124)
+        arrangement.add_layer("drums", LayerRole.DRUMS)
+        arrangement.layers["drums"].patterns["main"] = PatternRef(
+            ref="drums/four-on-floor", params={"hits": [1, 2]}
+        )
+        path = await manager.save(arrangement)
+
+        manager._cache.clear()
+        loaded = await manager.get("test")
+        assert loaded is not None
+        loaded.layers["drums"].patterns["main"].params["hits"].append(99)
+
+        manager._cache.clear()
+        reloaded = await manager.get("test")
+        assert reloaded is not None
+        assert reloaded.layers["drums"].patterns["main"].params == {"hits": [1, 2]}
+        assert (await manager.load(path)).layers["drums"].patterns["main"].params == {
+            "hits": [1, 2]
+        }
 
+    @pytest.mark.asyncio
+    async def test_list_arrangements(self, manager: ArrangementManager) -> None:
+        """List arrangements in directory."""
         # Create and save two arrangements
         arr1 = await manager.create(name="first", key="C_major", tempo=120)
         await manager.save(arr1)
@@ -468,10 +566,56 @@ class TestArrangementManager:
         assert len(arrangements) == 2
 
     @pytest.mark.asyncio
-    async def test_delete_arrangement(self, temp_dir: Path) -> None:
-        """Delete an arrangement."""
-        manager = ArrangementManager(temp_dir)
+    async def test_list_arrangements_reuses_parsed_files(
+        self, manager: ArrangementManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Listing unchanged files again skips YAML parsing."""
+        arrangement = await manager.create(name="first", key="C_major", tempo=120)
+        arrangement.add_section("intro", 8)
+        await manager.save(arrangement)
+        first = await manager.list_arrangements()
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("YAML re-parsed")
+
+        monkeypatch.setattr("chuk_mcp_music.arrangement.manager.yaml.load", fail)
+        second = await manager.list_arrangements()
+
+        assert [m.as_dict for m in second] == [m.as_dict for m in first]
+        assert second[0].total_bars == 8
+
+    @pytest.mark.asyncio
+    async def test_list_arrangements_forgets_removed_files(
+        self, manager: ArrangementManager
+    ) -> None:
+        """Files deleted outside the manager drop out of the listing cache."""
+        first = await manager.save(await manager.create(name="first", key="C_major", tempo=120))
+        second = await manager.save(await manager.create(name="second", key="D_minor", tempo=124))
+        await manager.list_arrangements()
+        assert set(manager._listing) == {first, second}
+
+        first.unlink()
+        arrangements = await manager.list_arrangements()
+
+        assert [m.name for m in arrangements] == ["second"]
+        assert set(manager._listing) == {second}
+
+    @pytest.mark.asyncio
+    async def test_list_arrangements_skips_unparseable_files(
+        self, manager: ArrangementManager, temp_dir: Path
+    ) -> None:
+        """Files that fail to parse are left out of the listing."""
+        await manager.save(await manager.create(name="good", key="C_major", tempo=120))
+        (temp_dir / "broken.arrangement.yaml").write_text("sections: [unclosed\n")
+
+        arrangements = await manager.list_arrangements()
 
+        assert [m.name for m in arrangements] == ["good"]
+        assert [p.name for p in manager._listing] == ["good.arrangement.yaml"]
+
+    @pytest.mark.asyncio
+    async def test_delete_arrangement(self, manager: ArrangementManager, temp_dir: Path) -> None:
+        """Delete an arrangement."""
         arrangement = await manager.create(name="test", key="D_minor", tempo=124)
         await manager.save(arrangement)
 
@@ -480,10 +624,8 @@ class TestArrangementManager:
         assert await manager.get("test") is None
 
     @pytest.mark.asyncio
-    async def test_add_section_via_manager(self, temp_dir: Path) -> None:
+    async def test_add_section_via_manager(self, manager: ArrangementManager) -> None:
         """Add section through manager."""
-        manager = ArrangementManager(temp_dir)
-
         await manager.create(name="test", key="D_minor", tempo=124)
         arrangement = await manager.add_section("test", "intro", 8, "low")
 
@@ -491,10 +633,30 @@ class TestArrangementManager:
         assert arrangement.sections[0].energy == EnergyLevel.LOW
 
     @pytest.mark.asyncio
-    async def test_assign_pattern_via_manager(self, temp_dir: Path) -> None:
-        """Assign pattern through manager."""
-        manager = ArrangementManager(temp_dir)
+    async def test_add_sections_and_layers_via_manager(self, manager: ArrangementManager) -> None:
+        """Bulk adds apply every entry, or none when one is invalid."""
+        await manager.create(name="test", key="D_minor", tempo=124)
+        arrangement = await manager.add_sections(
+            "test", [{"name": "intro", "bars": 8, "energy": "low"}, {"name": "verse", "bars": 16}]
+        )
+        assert arrangement.get_section_names() == ["intro", "verse"]
+        assert arrangement.sections[0].energy == EnergyLevel.LOW
 
+        with pytest.raises(ValueError):
+            await manager.add_sections("test", [{"name": "chorus", "bars": 8}, {"name": "x"}])
+        assert arrangement.get_section_names() == ["intro", "verse"]
+
+        await manager.add_layers("test", [{"name": "drums", "role": "drums"}])
+        with pytest.raises(ValueError):
+            await manager.add_layers(
+                "test", [{"name": "bass", "role": "bass"}, {"name": "lead", "role": "kazoo"}]
+            )
+        assert list(arrangement.layers) == ["drums"]
+        assert arrangement.layers["drums"].channel == 9
+
+    @pytest.mark.asyncio
+    async def test_assign_pattern_via_manager(self, manager: ArrangementManager) -> None:
+        """Assign pattern through manager."""
         await manager.create(name="test", key="D_minor", tempo=124)
         await manager.add_layer("test", "bass", "bass")
         arrangement = await manager.assign_pattern(
@@ -507,24 +669,63 @@ class TestArrangementManager:
         assert layer.patterns["main"].variant == "driving"
 
     @pytest.mark.asyncio
-    async def test_get_nonexistent(self, temp_dir: Path) -> None:
+    async def test_section_mutators_via_manager(self, manager: ArrangementManager) -> None:
+        """Remove, reorder and re-energize sections through manager."""
+        await manager.create(name="test", key="D_minor", tempo=124)
+        await manager.add_sections(
+            "test", [{"name": "intro", "bars": 8}, {"name": "verse", "bars": 16}]
+        )
+
+        arrangement = await manager.reorder_sections("test", ["verse", "intro"])
+        assert arrangement.get_section_names() == ["verse", "intro"]
+        with pytest.raises(ValueError, match="Section not found: outro"):
+            await manager.reorder_sections("test", ["verse", "outro"])
+
+        arrangement = await manager.set_section_energy("test", "intro", "high")
+        assert arrangement.sections[1].energy == EnergyLevel.HIGH
+        arrangement = await manager.set_section_energy("test", "intro", EnergyLevel.LOW)
+        assert arrangement.sections[1].energy == EnergyLevel.LOW
+
+        arrangement = await manager.remove_section("test", "verse")
+        assert arrangement.get_section_names() == ["intro"]
+        with pytest.raises(ValueError, match="Section not found"):
+            await manager.remove_section("test", "verse")
+
+        await manager.add_layer("test", "bass", "bass")
+        arrangement = await manager.remove_layer("test", "bass")
+        assert arrangement.layers == {}
+        with pytest.raises(ValueError, match="Layer not found"):
+            await manager.remove_layer("test", "bass")
+
+    @pytest.mark.asyncio
+    async def test_update_layer_via_manager(self, manager: ArrangementManager) -> None:
+        """Update layer settings through manager."""
+        await manager.create(name="test", key="D_minor", tempo=124)
+        await manager.add_layer("test", "bass", "bass")
+        layer = await manager.update_layer("test", "bass", muted=True, level=0.5)
+
+        assert layer.muted
+        assert layer.level == 0.5
+        with pytest.raises(ValueError, match="Layer not found"):
+            await manager.update_layer("test", "lead", solo=True)
+        with pytest.raises(ValueError, match="Arrangement not found"):
+            await manager.update_layer("nonexistent", "bass", solo=True)
+
+    @pytest.mark.asyncio
+    async def test_get_nonexistent(self, manager: ArrangementManager) -> None:
         """Get returns None for nonexistent arrangement."""
-        manager = ArrangementManager(temp_dir)
         result = await manager.get("nonexistent")
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_delete_nonexistent(self, temp_dir: Path) -> None:
+    async def test_delete_nonexistent(self, manager: ArrangementManager) -> None:
         """Delete returns False for nonexistent arrangement."""
-        manager = ArrangementManager(temp_dir)
         result = await manager.delete("nonexistent")
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_duplicate_arrangement(self, temp_dir: Path) -> None:
+    async def test_duplicate_arrangement(self, manager: ArrangementManager) -> None:
         """Duplicate an arrangement with new name."""
-        manager = ArrangementManager(temp_dir)
-
         arr = await manager.create(name="original", key="D_minor", tempo=124)
         arr.add_section("intro", 8)
         arr.add_layer("bass", LayerRole.BASS)
@@ -535,45 +736,41 @@ class TestArrangementManager:
         assert len(duplicate.sections) == 1
 
     @pytest.mark.asyncio
-    async def test_duplicate_nonexistent(self, temp_dir: Path) -> None:
+    async def test_duplicate_nonexistent(self, manager: ArrangementManager) -> None:
         """Duplicate raises ValueError for nonexistent arrangement."""
-        manager = ArrangementManager(temp_dir)
         with pytest.raises(ValueError, match="not found"):
             await manager.duplicate("nonexistent", "copy")
 
     @pytest.mark.asyncio
-    async def test_add_section_nonexistent(self, temp_dir: Path) -> None:
+    async def test_add_section_nonexistent(self, manager: ArrangementManager) -> None:
         """Add section raises ValueError for nonexistent arrangement."""
-        manager = ArrangementManager(temp_dir)
         with pytest.raises(ValueError, match="not found"):
             await manager.add_section("nonexistent", "intro", 8)
 
     @pytest.mark.asyncio
-    async def test_add_layer_nonexistent(self, temp_dir: Path) -> None:
+    async def test_add_layer_nonexistent(self, manager: ArrangementManager) -> None:
         """Add layer raises ValueError for nonexistent arrangement."""
-        manager = ArrangementManager(temp_dir)
         with pytest.raises(ValueError, match="not found"):
             await manager.add_layer("nonexistent", "bass", "bass")
 
     @pytest.mark.asyncio
-    async def test_assign_pattern_nonexistent_arrangement(self, temp_dir: Path) -> None:
+    async def test_assign_pattern_nonexistent_arrangement(
+        self, manager: ArrangementManager
+    ) -> None:
         """Assign pattern raises ValueError for nonexistent arrangement."""
-        manager = ArrangementManager(temp_dir)
         with pytest.raises(ValueError, match="not found"):
             await manager.assign_pattern("nonexistent", "bass", "main", "bass/root-pulse")
 
     @pytest.mark.asyncio
-    async def test_assign_pattern_nonexistent_layer(self, temp_dir: Path) -> None:
+    async def test_assign_pattern_nonexistent_layer(self, manager: ArrangementManager) -> None:
         """Assign pattern raises ValueError for nonexistent layer."""
-        manager = ArrangementManager(temp_dir)
         await manager.create(name="test", key="D_minor", tempo=124)
         with pytest.raises(ValueError, match="Layer not found"):
             await manager.assign_pattern("test", "bass", "main", "bass/root-pulse")
 
     @pytest.mark.asyncio
-    async def test_arrange_layer(self, temp_dir: Path) -> None:
+    async def test_arrange_layer(self, manager: ArrangementManager) -> None:
         """Arrange layer sets section patterns."""
-        manager = ArrangementManager(temp_dir)
         await manager.create(name="test", key="D_minor", tempo=124)
         await manager.add_section("test", "intro", 8)
         await manager.add_section("test", "verse", 16)
@@ -587,33 +784,29 @@ class TestArrangementManager:
         assert layer.arrangement["verse"] == "main"
 
     @pytest.mark.asyncio
-    async def test_arrange_layer_nonexistent_arrangement(self, temp_dir: Path) -> None:
+    async def test_arrange_layer_nonexistent_arrangement(self, manager: ArrangementManager) -> None:
         """Arrange layer raises ValueError for nonexistent arrangement."""
-        manager = ArrangementManager(temp_dir)
         with pytest.raises(ValueError, match="not found"):
             await manager.arrange_layer("nonexistent", "bass", {})
 
     @pytest.mark.asyncio
-    async def test_arrange_layer_nonexistent_layer(self, temp_dir: Path) -> None:
+    async def test_arrange_layer_nonexistent_layer(self, manager: ArrangementManager) -> None:
         """Arrange layer raises ValueError for nonexistent layer."""
-        manager = ArrangementManager(temp_dir)
         await manager.create(name="test", key="D_minor", tempo=124)
         with pytest.raises(ValueError, match="Layer not found"):
             await manager.arrange_layer("test", "bass", {})
 
     @pytest.mark.asyncio
-    async def test_set_harmony_default(self, temp_dir: Path) -> None:
+    async def test_set_harmony_default(self, manager: ArrangementManager) -> None:
         """Set default harmony progression."""
-        manager = ArrangementManager(temp_dir)
         await manager.create(name="test", key="D_minor", tempo=124)
 
         arrangement = await manager.set_harmony("test", None, ["i", "VI", "III", "VII"], "1bar")
         assert arrangement.harmony.default_progression == ["i", "VI", "III", "VII"]
 
     @pytest.mark.asyncio
-    async def test_set_harmony_section(self, temp_dir: Path) -> None:
+    async def test_set_harmony_section(self, manager: ArrangementManager) -> None:
         """Set harmony for specific section."""
-        manager = ArrangementManager(temp_dir)
         await manager.create(name="test", key="D_minor", tempo=124)
         await manager.add_section("test", "chorus", 16)
 
@@ -622,9 +815,8 @@ class TestArrangementManager:
         assert arrangement.harmony.sections["chorus"].progression == ["i", "VII"]
 
     @pytest.mark.asyncio
-    async def test_set_harmony_nonexistent(self, temp_dir: Path) -> None:
+    async def test_set_harmony_nonexistent(self, manager: ArrangementManager) -> None:
         """Set harmony raises ValueError for nonexistent arrangement."""
-        manager = ArrangementManager(temp_dir)
         with pytest.raises(ValueError, match="not found"):
             await manager.set_harmony("nonexistent", None, ["i"])
 
@@ -636,9 +828,8 @@ class TestArrangementManager:
         assert arrangements == []
 
     @pytest.mark.asyncio
-    async def test_create_with_style(self, temp_dir: Path) -> None:
+    async def test_create_with_style(self, manager: ArrangementManager) -> None:
         """Create arrangement with style."""
-        manager = ArrangementManager(temp_dir)
         arrangement = await manager.create(
             name="test",
             key="D_minor",
@@ -666,6 +857,32 @@ class TestArrangementManager:
         assert "D_minor" in repr(meta)
         assert "124" in repr(meta)
 
+    def test_arrangement_metadata_as_dict(self) -> None:
+        """ArrangementMetadata exposes listing fields as a cached dict."""
+        from datetime import datetime
+
+        from chuk_mcp_music.arrangement.manager import ArrangementMetadata
+
+        modified = datetime.now()
+        meta = ArrangementMetadata(
+            name="test",
+            path=Path("/tmp/test.yaml"),
+            key="D_minor",
+            tempo=124,
+            total_bars=56,
+            layer_count=3,
+            modified=modified,
+        )
+        assert meta.as_dict == {
+            "name": "test",
+            "key": "D_minor",
+            "tempo": 124,
+            "total_bars": 56,
+            "layers": 3,
+            "modified": modified,
+        }
+        assert meta.as_dict is meta.as_dict
+
 
 class TestValidationAdditional:
     """Additional tests for validation to increase coverage."""
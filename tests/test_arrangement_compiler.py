@@ -149,6 +149,18 @@ class TestArrangementCompiler:
         assert result.total_events > 0
         assert "verse" in result.sections_compiled
 
+    def test_midi_encoded_on_demand(
+        self, pattern_registry: PatternRegistry, simple_arrangement: Arrangement
+    ) -> None:
+        """MIDI is only encoded when the result's midi_file is used."""
+        compiler = ArrangementCompiler(pattern_registry)
+        result = compiler.compile(simple_arrangement)
+
+        assert "midi_file" not in vars(result)
+        midi = result.midi_file
+        assert midi.ticks_per_beat == result.score_ir.ticks_per_beat
+        assert result.midi_file is midi
+
     def test_muted_layer_excluded(
         self, pattern_registry: PatternRegistry, simple_arrangement: Arrangement
     ) -> None:
@@ -162,6 +162,19 @@ class TestPatternTemplate:
         assert template.bars == 4
         assert not template.loop
 
+    def test_is_dense(self) -> None:
+        """Density flag reflects template event count."""
+        sparse = PatternTemplate(
+            events=[PatternEvent(beat=0, duration="quarter", degree="chord.root")]
+        )
+        dense = PatternTemplate(
+            events=[
+                PatternEvent(beat=i * 0.5, duration="eighth", degree="chord.root") for i in range(9)
+            ]
+        )
+        assert sparse.is_dense is False
+        assert dense.is_dense is True
+
 
 class TestPattern:
     """Tests for Pattern model."""
@@ -203,6 +216,22 @@ class TestPattern:
         assert simple_pattern.role == LayerRole.BASS
         assert simple_pattern.pitched
 
+    def test_details(self, simple_pattern: Pattern) -> None:
+        """Details are computed once and read-only."""
+        details = simple_pattern.details
+        assert details["role"] == "bass"
+        assert details["parameters"]["density"]["default"] == "quarter"
+        assert details["variants"]["driving"]["params"] == {"density": "eighth"}
+        assert details["template"]["event_count"] == 1
+        assert simple_pattern.details is details
+        assert simple_pattern.pattern_id == "bass/" + simple_pattern.name
+        with pytest.raises(TypeError):
+            details["name"] = "other"  # type: ignore[index]
+
+        # Patterns are frozen, so the cached values can't go stale
+        with pytest.raises(ValueError):
+            simple_pattern.name = "renamed"
+
     def test_get_resolved_params_defaults(self, simple_pattern: Pattern) -> None:
         """Get resolved parameters with defaults."""
         params = simple_pattern.get_resolved_params()
@@ -506,6 +535,30 @@ class TestPatternRegistry:
         assert pattern.role == LayerRole.DRUMS
         assert not pattern.pitched
 
+    def test_get_patterns(self, library_path: Path) -> None:
+        """Get several patterns at once, cached or not."""
+        registry = PatternRegistry(library_path=library_path)
+        cached = registry.get_pattern("drums/four-on-floor")
+
+        patterns = registry.get_patterns(
+            iter(["drums/four-on-floor", "bass/missing", "bass/root-pulse"])
+        )
+
+        assert patterns[0] is cached
+        assert patterns[1] is None
+        assert patterns[2] is registry.get_pattern("bass/root-pulse")
+
+    def test_get_pattern_from_threads(self, library_path: Path) -> None:
+        """Concurrent first loads all get the same pattern object."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        registry = PatternRegistry(library_path=library_path)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            patterns = list(pool.map(registry.get_pattern, ["bass/root-pulse"] * 16))
+
+        assert patterns[0] is not None
+        assert all(p is patterns[0] for p in patterns)
+
     def test_get_nonexistent_pattern(self, library_path: Path) -> None:
         """Get a pattern that doesn't exist."""
         registry = PatternRegistry(library_path=library_path)
@@ -537,6 +590,58 @@ class TestPatternRegistry:
         assert pattern_id == "melody/dynamic-pattern"
         assert registry.get_pattern(pattern_id) is not None
 
+    def test_patterns_for_role(self, library_path: Path) -> None:
+        """Only the requested role is loaded, and the bucket is reused."""
+        registry = PatternRegistry(library_path=library_path)
+
+        bass = registry.patterns_for_role(LayerRole.BASS)
+
+        assert bass
+        assert all(p.role == LayerRole.BASS for p in bass)
+        assert all(pattern_id.startswith("bass/") for pattern_id in registry._cache)
+        assert registry.patterns_for_role(LayerRole.BASS) is bass
+
+        names = [p.name for p in registry.patterns_for_role(LayerRole.DRUMS)]
+        assert names == sorted(names)
+
+    def test_patterns_for_role_invalidated_on_register(self) -> None:
+        """Registering a pattern rebuilds the role buckets."""
+        registry = PatternRegistry()
+        assert registry.patterns_for_role(LayerRole.MELODY) == ()
+        assert registry.generation == 0
+
+        pattern = Pattern(
+            name="dynamic-pattern",
+            role=LayerRole.MELODY,
+            template=PatternTemplate(bars=1, events=[]),
+        )
+        registry.register_pattern(pattern)
+
+        assert registry.patterns_for_role(LayerRole.MELODY) == (pattern,)
+        assert registry.generation == 1
+
+    def test_list_pattern_summaries(self, library_path: Path) -> None:
+        """Summaries match list_patterns and are rebuilt after changes."""
+        registry = PatternRegistry(library_path=library_path)
+
+        summaries = registry.list_pattern_summaries(role=LayerRole.BASS)
+        assert [s["name"] for s in summaries] == [
+            m.name for m in registry.list_patterns(role=LayerRole.BASS)
+        ]
+        assert all(s["id"] == f"bass/{s['name']}" for s in summaries)
+        assert registry.list_pattern_summaries(role=LayerRole.BASS) is summaries
+
+        pattern = Pattern(
+            name="zz-dynamic",
+            role=LayerRole.BASS,
+            template=PatternTemplate(bars=1, events=[]),
+        )
+        registry.register_pattern(pattern)
+
+        updated = registry.list_pattern_summaries(role=LayerRole.BASS)
+        assert updated[-1]["id"] == "bass/zz-dynamic"
+        assert len(updated) == len(summaries) + 1
+
     def test_copy_to_project(self, library_path: Path) -> None:
         """Copy a pattern to project."""
         with tempfile.TemporaryDirectory() as tmpdir:
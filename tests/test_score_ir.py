@@ -9,6 +9,9 @@ Tests cover:
 - Golden file testing for key arrangements
 """
 
+import io
+import json
+
 import pytest
 
 from chuk_mcp_music.compiler import ArrangementCompiler
@@ -235,6 +238,17 @@ class TestScoreIR:
 
         assert canonical.notes == [note3, note2, note1]
 
+    def test_canonicalize_matches_note_ordering(self) -> None:
+        """Canonical order agrees with IRNote ordering, including ties on pitch."""
+        notes = [
+            IRNote(start_ticks=0, channel=0, pitch=60, duration_ticks=480, velocity=100),
+            IRNote(start_ticks=0, channel=0, pitch=60, duration_ticks=240, velocity=90),
+            IRNote(start_ticks=0, channel=0, pitch=60, duration_ticks=240, velocity=80),
+            IRNote(start_ticks=240, channel=2, pitch=40, duration_ticks=240, velocity=80),
+        ]
+        ir = ScoreIR(notes=list(reversed(notes)))
+        assert ir.canonicalize().notes == sorted(notes)
+
     def test_to_json_deterministic(self) -> None:
         """Same IR produces identical JSON output."""
         notes = [
@@ -286,6 +300,74 @@ class TestScoreIR:
         assert len(restored.notes) == 1
         assert restored.notes[0].pitch == 50
 
+    def test_write_json_matches_to_dict(self) -> None:
+        """Streamed JSON matches the dict form, with or without notes."""
+        ir = ScoreIR(
+            name="test",
+            notes=[
+                IRNote(start_ticks=480, channel=0, pitch=60, duration_ticks=480, velocity=100),
+                IRNote(start_ticks=0, channel=1, pitch=40, duration_ticks=240, velocity=90),
+            ],
+            sections=[IRSectionMarker(name="verse", start_ticks=0, end_ticks=960, bars=1)],
+            layers={"bass": {"role": "bass", "channel": 1}},
+        )
+
+        buf = io.BytesIO()
+        ir.write_json(buf)
+        assert json.loads(buf.getvalue()) == ir.to_dict()
+
+        buf = io.BytesIO()
+        ir.write_json(buf, include_notes=False)
+        data = json.loads(buf.getvalue())
+        assert data["notes"] == []
+        assert data["note_count"] == 2
+        assert data["sections"] == ir.to_dict()["sections"]
+
+    def test_columnar_round_trip(self) -> None:
+        """Columnar notes are canonical and parse back to the same IR."""
+        ir = ScoreIR(
+            name="test",
+            notes=[
+                IRNote(start_ticks=480, channel=0, pitch=60, duration_ticks=480, velocity=100),
+                IRNote(
+                    start_ticks=0,
+                    channel=1,
+                    pitch=40,
+                    duration_ticks=240,
+                    velocity=90,
+                    source_layer="bass",
+                    bar=1,
+                ),
+            ],
+        )
+
+        columns = ir.to_columns()
+        assert columns["start_ticks"] == [0, 480]
+        assert columns["source_layer"] == ["bass", None]
+        assert ScoreIR().to_columns()["pitch"] == []
+
+        buf = io.BytesIO()
+        ir.write_json(buf, columnar=True)
+        data = json.loads(buf.getvalue())
+        assert "notes" not in data
+        assert data["note_columns"] == columns
+
+        restored = ScoreIR.from_dict(data)
+        assert restored.to_dict() == ir.to_dict()
+
+        # Optional metadata columns may be omitted
+        required = {k: columns[k] for k in ("start_ticks", "channel", "pitch")}
+        required |= {k: columns[k] for k in ("duration_ticks", "velocity")}
+        minimal = ScoreIR.from_dict({"note_columns": required})
+        assert [n.pitch for n in minimal.notes] == [40, 60]
+        assert minimal.notes[0].source_layer is None
+
+        # Columns of different lengths are rejected rather than truncated
+        with pytest.raises(ValueError, match="note_columns lengths differ"):
+            ScoreIR.from_dict({"note_columns": required | {"pitch": [40]}})
+        with pytest.raises(ValueError, match="note_columns lengths differ"):
+            ScoreIR.from_dict({"note_columns": required | {"source_layer": ["bass"]}})
+
     def test_notes_by_layer(self) -> None:
         """Group notes by source layer."""
         ir = ScoreIR(
@@ -415,6 +497,12 @@ class TestScoreIR:
         assert diff["notes_unchanged"] == 1
         assert diff["tempo_changed"] is False
 
+        ir3 = ScoreIR(notes=[*ir1.notes, ir2.notes[1]])
+        diff = ir1.diff_summary(ir3)
+        assert (diff["notes_added"], diff["notes_removed"], diff["notes_unchanged"]) == (1, 0, 2)
+        diff = ir3.diff_summary(ir1)
+        assert (diff["notes_added"], diff["notes_removed"], diff["notes_unchanged"]) == (0, 1, 2)
+
 
 class TestGoldenFileIR:
     """Golden file tests for Score IR.
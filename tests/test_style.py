@@ -7,6 +7,7 @@ Tests cover:
 - StyleResolver constraint resolution and pattern suggestions
 """
 
+import os
 import tempfile
 from pathlib import Path
 
@@ -26,6 +27,7 @@ from chuk_mcp_music.models.style import (
     Style,
     StyleMetadata,
     TempoRange,
+    wildcard_matcher,
 )
 from chuk_mcp_music.styles import StyleLoader, StyleResolver, ViolationSeverity
 
@@ -140,6 +142,17 @@ class TestStyle:
         assert style.key_preference == KeyPreference.ANY
         assert style.time_signature == "4/4"
 
+    def test_details(self):
+        """Details are computed once and read-only."""
+        style = Style(name="test-style", tempo=TempoRange(min_bpm=120, max_bpm=128))
+        details = style.details
+        assert details["tempo"]["max"] == 128
+        assert details["key_preference"] == "any"
+        assert set(details["energy_levels"]) == {"lowest", "low", "medium", "high", "highest"}
+        assert style.details is details
+        with pytest.raises(TypeError):
+            details["name"] = "other"  # type: ignore[index]
+
     def test_full_style(self):
         """Can create a fully configured style."""
         style = Style(
@@ -210,6 +223,15 @@ class TestStyle:
         assert style.is_pattern_forbidden("bass/dubstep-wobble") is True
         assert style.is_pattern_forbidden("bass/root-pulse") is False
 
+    def test_wildcard_matcher(self):
+        """Wildcard matchers are compiled once and reused."""
+        matcher = wildcard_matcher(["drums/trap-*", "bass/dubstep-?"])
+        assert matcher("drums/trap-hihat") is True
+        assert matcher("bass/dubstep-1") is True
+        assert matcher("bass/dubstep-12") is False
+        assert wildcard_matcher(("drums/trap-*", "bass/dubstep-?")) is matcher
+        assert wildcard_matcher([])("anything") is False
+
     def test_validate_tempo(self):
         """Validates tempo against style range."""
         style = Style(
@@ -450,6 +472,19 @@ class TestStyleResolver:
         # The message says "discouraged" not "avoid"
         assert any("discouraged" in w.message.lower() for w in warnings)
 
+        # Avoid lists are per role
+        violations = resolver.validate_pattern(avoided_pattern, LayerRole.HARMONY)
+        assert not any("discouraged" in v.message.lower() for v in violations)
+
+    def test_validate_patterns(self, melodic_techno_style, sample_pattern):
+        """Validates several uses at once, keeping per-use order."""
+        resolver = StyleResolver(melodic_techno_style)
+        violations = resolver.validate_patterns(
+            [(sample_pattern, LayerRole.BASS), (sample_pattern, LayerRole.DRUMS)]
+        )
+        assert violations == resolver.validate_pattern(sample_pattern, LayerRole.DRUMS)
+        assert resolver.validate_patterns([]) == []
+
     def test_suggest_patterns(self, melodic_techno_style, sample_pattern):
         """Suggests patterns with scores."""
         resolver = StyleResolver(melodic_techno_style)
@@ -480,6 +515,27 @@ class TestStyleResolver:
         # Forbidden patterns should not appear in suggestions
         assert len(suggestions) == 0
 
+    def test_suggest_patterns_by_role(self, melodic_techno_style, sample_pattern):
+        """Only the bucket for the requested role is considered."""
+        resolver = StyleResolver(melodic_techno_style)
+        drum_pattern = Pattern(
+            name="minimal-techno",
+            role=LayerRole.DRUMS,
+            template=PatternTemplate(bars=1, events=[]),
+        )
+        by_role = {
+            LayerRole.BASS: (sample_pattern,),
+            LayerRole.DRUMS: (drum_pattern,),
+        }
+        suggestions = resolver.suggest_patterns(None, LayerRole.BASS, patterns_by_role=by_role)
+        assert [s.pattern_id for s in suggestions] == ["bass/root-pulse"]
+
+        # Exactly one source of patterns is required
+        with pytest.raises(ValueError):
+            resolver.suggest_patterns(None, LayerRole.BASS)
+        with pytest.raises(ValueError):
+            resolver.suggest_patterns([sample_pattern], LayerRole.BASS, patterns_by_role=by_role)
+
 
 class TestStyleYamlLoading:
     """Tests for loading styles from YAML files."""
@@ -572,6 +628,27 @@ class TestStyleLoaderEdgeCases:
             names = [s.name for s in styles]
             assert "melodic-techno" in names
 
+    def test_list_styles_reparses_changed_files(self):
+        """Listing reuses parsed metadata until a style file changes."""
+        library_path = (
+            Path(__file__).parent.parent / "src" / "chuk_mcp_music" / "styles" / "library"
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            project_path = Path(tmp)
+            loader = StyleLoader(library_path=library_path, project_path=project_path)
+            path = loader.copy_to_project("melodic-techno")
+            assert path is not None
+
+            first = {s.name: s for s in loader.list_styles()}
+            second = {s.name: s for s in loader.list_styles()}
+            assert second["melodic-techno"] is first["melodic-techno"]
+
+            path.write_text(path.read_text().replace("melodic-techno", "edited-techno"))
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            names = [s.name for s in loader.list_styles()]
+            assert "edited-techno" in names
+
     def test_get_style_metadata_via_style(self):
         """Get style metadata via style object."""
         library_path = (
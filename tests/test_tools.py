@@ -6,7 +6,7 @@ structure, and compilation.
 """
 
 import json
-import tempfile
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -31,13 +31,6 @@ class MockMCPServer:
         return func
 
 
-@pytest.fixture
-def temp_dir():
-    """Create temporary directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
-
-
 @pytest.fixture
 def library_path():
     """Path to pattern library."""
@@ -50,6 +43,94 @@ def styles_library_path():
     return Path(__file__).parent.parent / "src" / "chuk_mcp_music" / "styles" / "library"
 
 
+class TestResponses:
+    """Tests for the shared tool response helpers."""
+
+    def test_success_envelope(self):
+        """Success responses lead with status and keep field order."""
+        from chuk_mcp_music.tools.responses import success
+
+        result = success(name="test", tempo=(120, 128))
+        assert json.loads(result) == {"status": "success", "name": "test", "tempo": [120, 128]}
+        assert result.startswith('{"status":"success"')
+
+    def test_error_envelope(self):
+        """Error responses carry a message."""
+        from chuk_mcp_music.tools.responses import error
+
+        assert json.loads(error("boom")) == {"status": "error", "message": "boom"}
+        assert json.loads(error('say "hi"\n')) == {"status": "error", "message": 'say "hi"\n'}
+
+    def test_not_found_envelope(self):
+        """Not-found responses escape the name into the cached message prefix."""
+        from chuk_mcp_music.tools.responses import not_found
+
+        assert json.loads(not_found("Layer", "bass")) == {
+            "status": "error",
+            "message": "Layer not found: bass",
+        }
+        assert json.loads(not_found("Section", 'a "b"\\')) == {
+            "status": "error",
+            "message": 'Section not found: a "b"\\',
+        }
+
+    def test_log_failure_traceback_only_at_debug(self, caplog):
+        """Failures log a single line unless DEBUG is enabled."""
+        import logging
+
+        from chuk_mcp_music.tools.responses import log_failure
+
+        log = logging.getLogger("chuk_mcp_music.tests.responses")
+        with caplog.at_level(logging.INFO, logger=log.name):
+            log_failure(log, "Failed to run tool", ValueError("bad input"))
+        assert caplog.records[-1].getMessage() == "Failed to run tool: bad input"
+        assert not caplog.records[-1].exc_info
+
+        try:
+            raise ValueError("bad input")
+        except ValueError as e:
+            with caplog.at_level(logging.DEBUG, logger=log.name):
+                log_failure(log, "Failed to run tool", e)
+        assert caplog.records[-1].exc_info
+
+    @pytest.mark.asyncio
+    async def test_tool_response_catches_exceptions(self):
+        """Decorated tools turn exceptions into error responses."""
+        from chuk_mcp_music.tools.responses import success, tool_response
+
+        @tool_response("Failed to run tool")
+        async def tool(fail: bool) -> str:
+            """Tool docstring."""
+            if fail:
+                raise ValueError("bad input")
+            return success()
+
+        assert tool.__name__ == "tool"
+        assert tool.__doc__ == "Tool docstring."
+        assert json.loads(await tool(fail=False)) == {"status": "success"}
+        assert json.loads(await tool(fail=True)) == {"status": "error", "message": "bad input"}
+
+    @pytest.mark.asyncio
+    async def test_tool_response_expected_not_logged(self, caplog):
+        """Expected exception types are returned without logging."""
+        import logging
+
+        from chuk_mcp_music.tools.responses import tool_response
+
+        @tool_response("Failed to run tool", expected=(ValueError,))
+        async def tool(exc: Exception) -> str:
+            raise exc
+
+        with caplog.at_level(logging.INFO):
+            result = await tool(exc=ValueError("bad input"))
+            assert json.loads(result)["message"] == "bad input"
+            assert not caplog.records
+
+            result = await tool(exc=RuntimeError("broken"))
+            assert json.loads(result)["message"] == "broken"
+            assert caplog.records[-1].getMessage() == "Failed to run tool: broken"
+
+
 class TestArrangementTools:
     """Tests for arrangement tools."""
 
@@ -121,6 +202,9 @@ class TestArrangementTools:
         data = json.loads(result)
         assert data["status"] == "success"
         assert len(data["arrangements"]) == 2
+        # Datetimes are encoded as ISO 8601 strings
+        modified = data["arrangements"][0]["modified"]
+        assert datetime.fromisoformat(modified)
 
     @pytest.mark.asyncio
     async def test_save_arrangement(self, temp_dir: Path):
@@ -232,7 +316,7 @@ class TestStructureTools:
         assert data["sections"][0]["name"] == "intro"
 
     @pytest.mark.asyncio
-    async def test_add_section_not_found(self, temp_dir: Path):
+    async def test_add_section_not_found(self, temp_dir: Path, caplog):
         """Add section to nonexistent arrangement."""
         from chuk_mcp_music.tools.structure import register_structure_tools
 
@@ -243,6 +327,8 @@ class TestStructureTools:
         result = await tools["music_add_section"](arrangement="nonexistent", name="intro", bars=8)
         data = json.loads(result)
         assert data["status"] == "error"
+        # Bad input is reported to the client, not logged as a failure
+        assert not caplog.records
 
     @pytest.mark.asyncio
     async def test_remove_section(self, temp_dir: Path):
@@ -341,6 +427,12 @@ class TestStructureTools:
         data = json.loads(result)
         assert data["status"] == "error"
         assert "not found" in data["message"]
+        assert arr.get_section_names() == ["intro"]
+
+        result = await tools["music_reorder_sections"](arrangement="test", order=["intro", "intro"])
+        data = json.loads(result)
+        assert data["status"] == "error"
+        assert "duplicates" in data["message"]
 
     @pytest.mark.asyncio
     async def test_set_section_energy(self, temp_dir: Path):
@@ -394,6 +486,26 @@ class TestStructureTools:
         assert data["status"] == "error"
         assert "not found" in data["message"]
 
+    @pytest.mark.asyncio
+    async def test_set_section_energy_unknown_level(self, temp_dir: Path):
+        """Unknown energy tokens are rejected with the valid choices."""
+        from chuk_mcp_music.tools.structure import register_structure_tools
+
+        mcp = MockMCPServer("test")
+        manager = ArrangementManager(temp_dir)
+        tools = register_structure_tools(mcp, manager)
+
+        arr = await manager.create(name="test", key="D_minor", tempo=124)
+        arr.add_section("intro", 8)
+
+        result = await tools["music_set_section_energy"](
+            arrangement="test", section="intro", energy="loud"
+        )
+        data = json.loads(result)
+        assert data["status"] == "error"
+        assert "Unknown energy level: loud" in data["message"]
+        assert arr.sections[0].energy is None
+
     @pytest.mark.asyncio
     async def test_add_layer(self, temp_dir: Path):
         """Add layer tool."""
@@ -413,6 +525,38 @@ class TestStructureTools:
         # Response has layers list, check first layer
         assert any(layer["name"] == "bass" for layer in data["layers"])
 
+    @pytest.mark.asyncio
+    async def test_add_sections_and_layers(self, temp_dir: Path):
+        """Batch add tools return the full section and layer lists."""
+        from chuk_mcp_music.tools.structure import register_structure_tools
+
+        mcp = MockMCPServer("test")
+        manager = ArrangementManager(temp_dir)
+        tools = register_structure_tools(mcp, manager)
+
+        await manager.create(name="test", key="D_minor", tempo=124)
+
+        result = await tools["music_add_sections"](
+            arrangement="test",
+            sections=[{"name": "intro", "bars": 8, "energy": "low"}, {"name": "verse", "bars": 16}],
+        )
+        data = json.loads(result)
+        assert data["status"] == "success"
+        assert data["sections"][0] == {"name": "intro", "bars": 8, "energy": "low"}
+        assert data["total_bars"] == 24
+
+        result = await tools["music_add_layers"](
+            arrangement="test",
+            layers=[{"name": "drums", "role": "drums"}, {"name": "bass", "role": "bass"}],
+        )
+        data = json.loads(result)
+        assert data["status"] == "success"
+        assert [layer["name"] for layer in data["layers"]] == ["drums", "bass"]
+        assert data["layers"][0] == {"name": "drums", "role": "drums", "channel": 9}
+
+        result = await tools["music_add_sections"](arrangement="missing", sections=[])
+        assert json.loads(result)["status"] == "error"
+
     @pytest.mark.asyncio
     async def test_add_layer_not_found(self, temp_dir: Path):
         """Add layer to nonexistent arrangement."""
@@ -620,6 +764,17 @@ class TestStructureTools:
         assert data["status"] == "success"
         assert data["level"] == 0.8
 
+        from chuk_mcp_music.tools.responses import success
+
+        # Matches the generic envelope byte for byte
+        assert result == success(layer="bass", level=0.8)
+
+        for requested, clamped in ((5.0, 2.0), (-1.0, 0.0), (float("nan"), 2.0)):
+            result = await tools["music_set_layer_level"](
+                arrangement="test", name="bass", level=requested
+            )
+            assert json.loads(result)["level"] == clamped
+
     @pytest.mark.asyncio
     async def test_set_layer_level_not_found(self, temp_dir: Path):
         """Set layer level on nonexistent arrangement."""
@@ -807,10 +962,19 @@ class TestPatternTools:
         manager = ArrangementManager(temp_dir)
         registry = PatternRegistry(library_path=library_path, project_path=temp_dir / "patterns")
         tools = register_pattern_tools(mcp, manager, registry)
+        registry.list_patterns()
+        generation = registry.generation
 
         result = await tools["music_copy_pattern_to_project"](pattern_id="bass/root-pulse")
         data = json.loads(result)
         assert data["status"] == "success"
+        assert Path(data["path"]).exists()
+
+        # Caches are invalidated so the project copy is picked up
+        assert registry.generation == generation + 1
+        meta = registry.get_pattern_metadata("bass/root-pulse")
+        assert meta is not None
+        assert meta.path == data["path"]
 
     @pytest.mark.asyncio
     async def test_copy_pattern_not_found(self, temp_dir: Path, library_path: Path):
@@ -1021,6 +1185,18 @@ class TestPatternTools:
         assert data["status"] == "success"
         assert data["pattern"]["params"]["velocity_base"] == 0.7
 
+        # A variant-only update keeps the merged params
+        result = await tools["music_update_pattern_params"](
+            arrangement="test",
+            layer="bass",
+            alias="main",
+            variant="driving",
+        )
+        data = json.loads(result)
+        assert data["pattern"]["variant"] == "driving"
+        assert data["pattern"]["params"] == {"velocity_base": 0.7}
+        assert arr.layers["bass"].patterns["main"].variant == "driving"
+
     @pytest.mark.asyncio
     async def test_update_pattern_params_not_found(self, temp_dir: Path, library_path: Path):
         """Update pattern on nonexistent arrangement."""
@@ -1118,6 +1294,13 @@ class TestStyleTools:
         assert data["status"] == "success"
         assert data["style"]["name"] == "melodic-techno"
 
+        # Served from cache until the loader reloads the style
+        assert await tools["music_describe_style"](name="melodic-techno") is result
+        style_loader.clear_cache()
+        again = await tools["music_describe_style"](name="melodic-techno")
+        assert again is not result
+        assert again == result
+
     @pytest.mark.asyncio
     async def test_describe_style_not_found(
         self, temp_dir: Path, library_path: Path, styles_library_path: Path
@@ -1198,6 +1381,19 @@ class TestStyleTools:
         data = json.loads(result)
         assert data["status"] == "success"
 
+        # Out-of-range tempo warns; a drum pattern on a bass layer is an error
+        await manager.create(name="off-style", key="D_minor", tempo=90)
+        await manager.add_layer("off-style", "bass", "bass")
+        await manager.assign_pattern("off-style", "bass", "main", "drums/four-on-floor")
+
+        result = await tools["music_validate_style"](
+            arrangement="off-style", style="melodic-techno"
+        )
+        data = json.loads(result)
+        assert data["valid"] is False
+        assert [e["element"] for e in data["errors"]] == ["drums/four-on-floor"]
+        assert "tempo" in [w["element"] for w in data["warnings"]]
+
     @pytest.mark.asyncio
     async def test_copy_style_to_project(
         self, temp_dir: Path, library_path: Path, styles_library_path: Path
@@ -1369,6 +1565,43 @@ class TestCompilationTools:
         assert data["status"] == "success"
         assert Path(data["path"]).exists()
 
+        import mido
+
+        midi = mido.MidiFile(data["path"])
+        assert sum(msg.type == "note_on" for msg in midi) > 0
+
+    @pytest.mark.asyncio
+    async def test_compile_midi_batch(self, temp_dir: Path, library_path: Path):
+        """Compile several arrangements, reporting each one separately."""
+        from chuk_mcp_music.tools.compilation import register_compilation_tools
+
+        mcp = MockMCPServer("test")
+        manager = ArrangementManager(temp_dir)
+        registry = PatternRegistry(library_path=library_path)
+        output_dir = temp_dir / "output"
+        tools = register_compilation_tools(mcp, manager, registry, output_dir)
+
+        for name, bars in (("one", 4), ("two", 8)):
+            arr = await manager.create(name=name, key="D_minor", tempo=124)
+            arr.add_section("verse", bars)
+
+        result = await tools["music_compile_midi_batch"](arrangements=["one", "missing", "two"])
+        data = json.loads(result)
+        assert data["status"] == "success"
+        assert data["compiled"] == 2
+        assert data["failed"] == 1
+        assert [r["arrangement"] for r in data["results"]] == ["one", "missing", "two"]
+        assert data["results"][1]["status"] == "error"
+        assert data["results"][2]["total_bars"] == 8
+        assert (output_dir / "one.mid").exists()
+        assert (output_dir / "two.mid").exists()
+
+        # Repeated names are compiled once
+        result = await tools["music_compile_midi_batch"](arrangements=["two", "one", "two"])
+        data = json.loads(result)
+        assert [r["arrangement"] for r in data["results"]] == ["two", "one"]
+        assert data["compiled"] == 2
+
     @pytest.mark.asyncio
     async def test_preview_section(self, temp_dir: Path, library_path: Path):
         """Preview a single section."""
@@ -1444,6 +1677,61 @@ class TestCompilationTools:
         data = json.loads(result)
         assert data["status"] == "error"
 
+    @pytest.mark.asyncio
+    async def test_compile_failure_after_cancel_not_cached(
+        self, temp_dir: Path, library_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """A compile that fails after its caller was cancelled isn't served from cache."""
+        import asyncio
+        import threading
+
+        from chuk_mcp_music.compiler import ArrangementCompiler
+        from chuk_mcp_music.tools.compilation import register_compilation_tools
+
+        mcp = MockMCPServer("test")
+        manager = ArrangementManager(temp_dir)
+        registry = PatternRegistry(library_path=library_path)
+        output_dir = temp_dir / "output"
+        tools = register_compilation_tools(mcp, manager, registry, output_dir)
+
+        arr = await manager.create(name="test", key="D_minor", tempo=124)
+        arr.add_section("verse", 4)
+
+        started = threading.Event()
+        release = threading.Event()
+        finished = threading.Event()
+        calls = []
+        real_compile = ArrangementCompiler.compile
+
+        def compile_once_failing(self, arrangement):
+            calls.append(arrangement.name)
+            if len(calls) == 1:
+                started.set()
+                release.wait()
+                try:
+                    raise RuntimeError("compile failed")
+                finally:
+                    finished.set()
+            return real_compile(self, arrangement)
+
+        monkeypatch.setattr(ArrangementCompiler, "compile", compile_once_failing)
+
+        first = asyncio.ensure_future(tools["music_compile_midi"](arrangement="test"))
+        await asyncio.to_thread(started.wait)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        # Let the shielded compile fail with no caller left awaiting it
+        release.set()
+        await asyncio.to_thread(finished.wait)
+        await asyncio.sleep(0.05)
+
+        result = await tools["music_compile_midi"](arrangement="test")
+        data = json.loads(result)
+        assert data["status"] == "success"
+        assert len(calls) == 2
+
     @pytest.mark.asyncio
     async def test_preview_section_not_found(self, temp_dir: Path, library_path: Path):
         """Preview section on nonexistent arrangement."""
@@ -1891,6 +2179,11 @@ class TestToolsExceptionHandling:
         data = json.loads(result)
         assert data["status"] == "success"
 
+        result = await tools["music_suggest_patterns"](style="melodic-techno", role="kazoo")
+        data = json.loads(result)
+        assert data["status"] == "error"
+        assert "Unknown role: kazoo" in data["message"]
+
     @pytest.mark.asyncio
     async def test_mute_layer_nonexistent_arrangement(self, temp_dir: Path):
         """Mute layer in nonexistent arrangement."""
@@ -2140,6 +2433,29 @@ class TestCompilationIRTools:
         assert data["score_ir"]["notes"] == []
         assert "note_count" in data["score_ir"]
 
+    @pytest.mark.asyncio
+    async def test_compile_to_ir_reflects_edits(self, temp_dir: Path, library_path: Path):
+        """Cached compiles are not reused once the arrangement changes."""
+        from chuk_mcp_music.tools.compilation import register_compilation_tools
+
+        mcp = MockMCPServer("test")
+        manager = ArrangementManager(temp_dir)
+        registry = PatternRegistry(library_path=library_path)
+        output_dir = temp_dir / "output"
+        tools = register_compilation_tools(mcp, manager, registry, output_dir)
+
+        arr = await manager.create(name="test", key="D_minor", tempo=124)
+        arr.add_section("verse", 4)
+
+        first = json.loads(await tools["music_compile_to_ir"](arrangement="test"))
+        again = json.loads(await tools["music_compile_to_ir"](arrangement="test"))
+        assert first == again
+        assert first["score_ir"]["total_bars"] == 4
+
+        arr.add_section("chorus", 8)
+        data = json.loads(await tools["music_compile_to_ir"](arrangement="test"))
+        assert data["score_ir"]["total_bars"] == 12
+
     @pytest.mark.asyncio
     async def test_compile_to_ir_not_found(self, temp_dir: Path, library_path: Path):
         """Compile to IR for nonexistent arrangement."""
@@ -2206,6 +2522,13 @@ class TestCompilationIRTools:
         assert data["arrangement_a"] == "track-v1"
         assert data["arrangement_b"] == "track-v2"
 
+        # Diffing an arrangement against itself shares a single compile
+        result = await tools["music_diff_ir"](arrangement="track-v1", other_arrangement="track-v1")
+        data = json.loads(result)
+        assert data["status"] == "success"
+        assert data["diff"]["notes_added"] == 0
+        assert data["diff"]["notes_removed"] == 0
+
     @pytest.mark.asyncio
     async def test_diff_ir_first_not_found(self, temp_dir: Path, library_path: Path):
         """Diff with first arrangement not found."""
@@ -2276,6 +2599,100 @@ class TestCompilationIRTools:
         assert Path(data["path"]).exists()
         assert "from-ir.mid" in data["path"]
 
+    @pytest.mark.asyncio
+    async def test_ir_round_trip_with_objects(self, temp_dir: Path, library_path: Path):
+        """Modify and emit accept the decoded score_ir object directly."""
+        from chuk_mcp_music.tools.compilation import register_compilation_tools
+
+        mcp = MockMCPServer("test")
+        manager = ArrangementManager(temp_dir)
+        registry = PatternRegistry(library_path=library_path)
+        output_dir = temp_dir / "output"
+        tools = register_compilation_tools(mcp, manager, registry, output_dir)
+
+        arr = await manager.create(name="test", key="D_minor", tempo=124)
+        arr.add_section("verse", 4)
+        arr.add_layer("bass", LayerRole.BASS)
+        from chuk_mcp_music.models.arrangement import PatternRef
+
+        arr.layers["bass"].patterns["main"] = PatternRef(ref="bass/root-pulse")
+        arr.layers["bass"].arrangement["verse"] = "main"
+
+        ir_data = json.loads(await tools["music_compile_to_ir"](arrangement="test"))
+        modified = json.loads(
+            await tools["music_modify_ir"](ir_json=ir_data["score_ir"], transpose=12)
+        )
+        assert modified["status"] == "success"
+
+        result = await tools["music_emit_midi_from_ir"](
+            ir_json=modified["score_ir"], output_name="from-object"
+        )
+        data = json.loads(result)
+        assert data["status"] == "success"
+        assert Path(data["path"]).exists()
+
+    @pytest.mark.asyncio
+    async def test_compile_to_ir_columnar(self, temp_dir: Path, library_path: Path):
+        """Columnar IR carries the same notes and can be emitted."""
+        from chuk_mcp_music.tools.compilation import register_compilation_tools
+
+        mcp = MockMCPServer("test")
+        manager = ArrangementManager(temp_dir)
+        registry = PatternRegistry(library_path=library_path)
+        output_dir = temp_dir / "output"
+        tools = register_compilation_tools(mcp, manager, registry, output_dir)
+
+        arr = await manager.create(name="test", key="D_minor", tempo=124)
+        arr.add_section("verse", 4)
+        arr.add_layer("bass", LayerRole.BASS)
+        from chuk_mcp_music.models.arrangement import PatternRef
+
+        arr.layers["bass"].patterns["main"] = PatternRef(ref="bass/root-pulse")
+        arr.layers["bass"].arrangement["verse"] = "main"
+
+        rows = json.loads(await tools["music_compile_to_ir"](arrangement="test"))
+        cols = json.loads(await tools["music_compile_to_ir"](arrangement="test", columnar=True))
+        columns = cols["score_ir"]["note_columns"]
+        assert columns["pitch"] == [n["pitch"] for n in rows["score_ir"]["notes"]]
+
+        result = await tools["music_emit_midi_from_ir"](
+            ir_json=json.dumps(cols["score_ir"]), output_name="columnar"
+        )
+        data = json.loads(result)
+        assert data["status"] == "success"
+        assert data["summary"]["total_notes"] == len(columns["pitch"])
+
+    def test_parse_score_ir_cached(self):
+        """Identical IR JSON strings are parsed once."""
+        from chuk_mcp_music.compiler.score_ir import ScoreIR
+        from chuk_mcp_music.tools.compilation import _parse_score_ir
+
+        ir_json = ScoreIR(name="cached").to_json()
+        first = _parse_score_ir(ir_json)
+        assert _parse_score_ir(ir_json) is first
+        assert _parse_score_ir(json.loads(ir_json)) is not first
+
+    def test_modify_score_ir_include_and_exclude(self):
+        """Excludes still apply when combined with includes."""
+        from chuk_mcp_music.compiler.score_ir import IRNote, ScoreIR
+        from chuk_mcp_music.tools.compilation import _modify_score_ir
+
+        notes = [
+            IRNote(0, 0, 60, 480, 100, source_layer="bass", source_section="verse"),
+            IRNote(0, 1, 62, 480, 100, source_layer="lead", source_section="verse"),
+            IRNote(480, 0, 64, 480, 100, source_layer="bass", source_section="chorus"),
+        ]
+        ir = ScoreIR(name="test", notes=notes)
+
+        result = _modify_score_ir(ir, filter_layers=["bass", "lead"], exclude_layers=["lead"])
+        assert result.notes == [notes[0], notes[2]]
+
+        result = _modify_score_ir(ir, filter_layers=["bass"], exclude_layers=["bass"])
+        assert result.notes == []
+
+        result = _modify_score_ir(ir, exclude_sections=["verse"])
+        assert result.notes == [notes[2]]
+
     @pytest.mark.asyncio
     async def test_emit_midi_from_ir_invalid_json(self, temp_dir: Path, library_path: Path):
         """Emit MIDI from invalid IR JSON."""
@@ -2331,6 +2748,33 @@ class TestCompilationIRTools:
         for note in data["score_ir"]["notes"]:
             assert note["source_layer"] == "bass"
 
+    @pytest.mark.asyncio
+    async def test_modify_ir_no_modifications(self, temp_dir: Path, library_path: Path):
+        """Modify IR with no options passes notes through unchanged."""
+        from chuk_mcp_music.tools.compilation import register_compilation_tools
+
+        mcp = MockMCPServer("test")
+        manager = ArrangementManager(temp_dir)
+        registry = PatternRegistry(library_path=library_path)
+        output_dir = temp_dir / "output"
+        tools = register_compilation_tools(mcp, manager, registry, output_dir)
+
+        arr = await manager.create(name="test", key="D_minor", tempo=124)
+        arr.add_section("verse", 4)
+        arr.add_layer("bass", LayerRole.BASS)
+        from chuk_mcp_music.models.arrangement import PatternRef
+
+        arr.layers["bass"].patterns["main"] = PatternRef(ref="bass/root-pulse")
+        arr.layers["bass"].arrangement["verse"] = "main"
+
+        ir_data = json.loads(await tools["music_compile_to_ir"](arrangement="test"))
+        result = await tools["music_modify_ir"](ir_json=json.dumps(ir_data["score_ir"]))
+        data = json.loads(result)
+        assert data["status"] == "success"
+        assert data["score_ir"]["name"] == "test_modified"
+        assert data["score_ir"]["notes"] == ir_data["score_ir"]["notes"]
+        assert data["score_ir"]["sections"] == ir_data["score_ir"]["sections"]
+
     @pytest.mark.asyncio
     async def test_modify_ir_exclude_layers(self, temp_dir: Path, library_path: Path):
         """Modify IR by excluding layers."""